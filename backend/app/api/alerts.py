@@ -2,23 +2,47 @@
 급매 알림 API
 
 KB시세 대비 할인율이 높은 단지를 조회합니다.
-- GET /api/alerts/bargains : 급매 알림 목록 (할인율/시간 필터 지원)
+- GET /api/alerts/bargains            : 급매 알림 목록 (할인율/시간 필터 지원)
+- GET /api/alerts/bargains/export.csv : 급매 목록 전체 CSV 내보내기 (스트리밍)
 """
 
+import csv
+import io
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import desc
-from sqlalchemy.orm import Session
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from sqlalchemy import desc, func, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel, ConfigDict
 
-from app.models.database import get_db
+from app.models.database import AsyncSessionLocal, get_async_db
 from app.models.apartment import ApartmentComplex, ComplexComparison
 
 logger = logging.getLogger(__name__)
 
+# CSV 내보내기: DB에서 한 번에 가져올 행 수 (서버 사이드 커서 단위)
+EXPORT_CHUNK_SIZE = 1000
+
+# 급매 목록 응답 컬럼 (라벨 = BargainItem 필드명)
+BARGAIN_COLUMNS = (
+    ApartmentComplex.name.label("complex_name"),
+    ApartmentComplex.sigungu,
+    ApartmentComplex.dong,
+    ComplexComparison.area_sqm,
+    ComplexComparison.deal_discount_rate.label("discount_rate"),
+    ComplexComparison.kb_price_mid.label("kb_price"),
+    ComplexComparison.recent_deal_price,
+    ComplexComparison.compared_at,
+)
+
+EXPORT_HEADER = (
+    "단지명", "시도", "시군구", "법정동", "전용면적(m2)",
+    "할인율(%)", "KB시세(만원)", "최근실거래가(만원)", "최근거래일", "비교시각",
+)
+
 router = APIRouter(prefix="/api/alerts", tags=["alerts"])
 
 
@@ -34,8 +58,7 @@ class BargainItem(BaseModel):
     recent_deal_price: Optional[int]
     compared_at: Optional[datetime]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BargainResponse(BaseModel):
@@ -48,11 +71,11 @@ class BargainResponse(BaseModel):
 
 # ── 급매 알림 엔드포인트 ─────────────────────────────────
 @router.get("/bargains", response_model=BargainResponse)
-def get_bargain_alerts(
+async def get_bargain_alerts(
     min_discount: float = Query(5.0, description="최소 할인율 (%)"),
     since_hours: int = Query(24, description="최근 N시간 이내 비교 데이터"),
     limit: int = Query(20, ge=1, le=100, description="최대 조회 건수"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """KB시세 대비 할인율이 높은 급매 단지를 반환합니다.
 
@@ -64,30 +87,25 @@ def get_bargain_alerts(
     cutoff = datetime.utcnow() - timedelta(hours=since_hours)
 
     # ComplexComparison JOIN ApartmentComplex — 할인율 + 시간 필터
-    query = (
-        db.query(ComplexComparison, ApartmentComplex)
+    # 응답에 필요한 컬럼만 조회하고, 전체 건수는 윈도우 함수로 같은 쿼리에서 함께 조회
+    # lambda_stmt: SELECT 구성/컴파일 결과를 재사용 (조건 값은 바인드 파라미터)
+    stmt = lambda_stmt(lambda: (
+        select(
+            *BARGAIN_COLUMNS,
+            func.count().over().label("total"),
+        )
         .join(ApartmentComplex, ComplexComparison.complex_id == ApartmentComplex.id)
-        .filter(ComplexComparison.deal_discount_rate > min_discount)
-        .filter(ComplexComparison.compared_at >= cutoff)
+        .where(ComplexComparison.deal_discount_rate > min_discount)
+        .where(ComplexComparison.compared_at >= cutoff)
         .order_by(desc(ComplexComparison.deal_discount_rate))
-    )
+        .limit(limit)
+    ))
+
+    rows = (await db.execute(stmt)).mappings().all()
+    total = rows[0]["total"] if rows else 0
 
-    total = query.count()
-    rows = query.limit(limit).all()
-
-    # 응답 조립
-    items = []
-    for comp, cpx in rows:
-        items.append(BargainItem(
-            complex_name=cpx.name,
-            sigungu=cpx.sigungu,
-            dong=cpx.dong,
-            area_sqm=comp.area_sqm,
-            discount_rate=comp.deal_discount_rate,
-            kb_price=comp.kb_price_mid,
-            recent_deal_price=comp.recent_deal_price,
-            compared_at=comp.compared_at,
-        ))
+    # 응답 조립 (컬럼 라벨 = 스키마 필드명, DB 값이 스키마 타입과 일치하므로 검증 생략)
+    items = [BargainItem.model_construct(**row) for row in rows]
 
     return BargainResponse(
         total=total,
@@ -95,3 +113,63 @@ def get_bargain_alerts(
         since_hours=since_hours,
         items=items,
     )
+
+
+# ── 급매 CSV 내보내기 ────────────────────────────────────
+async def _iter_bargain_csv(min_discount: float, cutoff: datetime) -> AsyncIterator[str]:
+    """급매 목록을 CSV 청크 단위로 생성한다.
+
+    서버 사이드 커서로 EXPORT_CHUNK_SIZE 행씩 읽어 바로 내보내므로
+    전체 결과를 메모리에 올리지 않는다. 응답 스트리밍 동안 유지되는
+    별도 세션을 사용한다.
+    """
+    stmt = (
+        select(
+            ApartmentComplex.name,
+            ApartmentComplex.sido,
+            ApartmentComplex.sigungu,
+            ApartmentComplex.dong,
+            ComplexComparison.area_sqm,
+            ComplexComparison.deal_discount_rate,
+            ComplexComparison.kb_price_mid,
+            ComplexComparison.recent_deal_price,
+            ComplexComparison.recent_deal_date,
+            ComplexComparison.compared_at,
+        )
+        .join(ApartmentComplex, ComplexComparison.complex_id == ApartmentComplex.id)
+        .where(ComplexComparison.deal_discount_rate > min_discount)
+        .where(ComplexComparison.compared_at >= cutoff)
+        .order_by(desc(ComplexComparison.deal_discount_rate))
+        .execution_options(yield_per=EXPORT_CHUNK_SIZE)
+    )
+
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+    buf.write("\ufeff")
+    writer.writerow(EXPORT_HEADER)
+
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(stmt)
+        async for rows in result.partitions():
+            writer.writerows(rows)
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+
+    if buf.tell():
+        yield buf.getvalue()
+
+
+@router.get("/bargains/export.csv", summary="급매 목록 CSV 내보내기")
+async def export_bargain_alerts(
+    min_discount: float = Query(5.0, description="최소 할인율 (%)"),
+    since_hours: int = Query(24, description="최근 N시간 이내 비교 데이터"),
+):
+    """조건에 맞는 급매 단지 전체를 CSV로 스트리밍합니다 (건수 제한 없음)."""
+    cutoff = datetime.utcnow() - timedelta(hours=since_hours)
+    return StreamingResponse(
+        _iter_bargain_csv(min_discount, cutoff),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": 'attachment; filename="bargains.csv"'},
+    )
@@ -9,21 +9,59 @@ KB시세 vs 실거래가 비교 데이터를 기반으로 단지 목록을 조
 import logging
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import desc, asc
+from sqlalchemy import desc, asc, func, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional
 
-from app.models.database import get_db
+from app.models.database import estimate_count, get_async_db, get_db
 from app.models.apartment import ApartmentComplex, ComplexComparison
 from app.schemas.complex import ComplexListItem, ComplexListResponse
+from app.services import cache_service
 
 logger = logging.getLogger(__name__)
 
+# 예상 행 수가 이보다 작으면 근사치 대신 정확한 건수를 계산
+ESTIMATE_COUNT_MIN_ROWS = 1000
+
+# 목록 응답 컬럼 (라벨 = ComplexListItem 필드명)
+LIST_COLUMNS = (
+    ApartmentComplex.id.label("complex_id"),
+    ApartmentComplex.name,
+    ApartmentComplex.sido,
+    ApartmentComplex.sigungu,
+    ApartmentComplex.dong,
+    ApartmentComplex.built_year,
+    ApartmentComplex.total_units,
+    ComplexComparison.area_sqm,
+    ComplexComparison.kb_price_mid,
+    ComplexComparison.recent_deal_price,
+    ComplexComparison.recent_deal_date,
+    ComplexComparison.deal_discount_rate,
+    ComplexComparison.deal_count_3m,
+    ComplexComparison.compared_at,
+)
+
+# 정렬 기준 → 컬럼
+SORT_COLUMN_MAP = {
+    "deal_discount_rate": ComplexComparison.deal_discount_rate,
+    "kb_price_mid": ComplexComparison.kb_price_mid,
+    "recent_deal_price": ComplexComparison.recent_deal_price,
+    "deal_count_3m": ComplexComparison.deal_count_3m,
+}
+
+# (정렬 기준, 방향) → ORDER BY 절 (요청마다 표현식을 새로 만들지 않도록 모듈 로드 시 생성)
+_ORDER_CLAUSES = {
+    (sort_by, direction): (asc(col) if direction == "asc" else desc(col))
+    for sort_by, col in SORT_COLUMN_MAP.items()
+    for direction in ("asc", "desc")
+}
+
 router = APIRouter(prefix="/api/complexes", tags=["complexes"])
 
 
 @router.get("", response_model=ComplexListResponse)
-def list_complexes(
+async def list_complexes(
     sido: Optional[str] = Query(None, description="시/도 필터"),
     sigungu: Optional[str] = Query(None, description="시/군/구 필터"),
     name: Optional[str] = Query(None, description="단지명 검색 (부분 일치)"),
@@ -32,7 +70,7 @@ def list_complexes(
     order: str = Query("desc", description="정렬 방향: desc | asc"),
     limit: int = Query(100, ge=1, le=500, description="최대 조회 건수"),
     offset: int = Query(0, ge=0, description="오프셋"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """KB시세 vs 실거래가 비교 단지 목록을 반환합니다.
 
@@ -40,60 +78,80 @@ def list_complexes(
     - min_discount 파라미터로 급매(할인율 양수) 필터 가능
     - 정렬 기준과 방향 지정 가능
     """
-    # ComplexComparison JOIN ApartmentComplex
-    query = (
-        db.query(ComplexComparison, ApartmentComplex)
-        .join(ApartmentComplex, ComplexComparison.complex_id == ApartmentComplex.id)
-    )
+    filters = []
 
     # 지역 필터
     if sido:
-        query = query.filter(ApartmentComplex.sido == sido)
+        filters.append(ApartmentComplex.sido == sido)
     if sigungu:
-        query = query.filter(ApartmentComplex.sigungu == sigungu)
+        filters.append(ApartmentComplex.sigungu == sigungu)
 
     # 단지명 검색 필터 (ILIKE: 대소문자 무시 부분 일치)
     if name:
-        query = query.filter(ApartmentComplex.name.ilike(f"%{name}%"))
+        filters.append(ApartmentComplex.name.ilike(f"%{name}%"))
 
     # 급매 필터
     if min_discount is not None:
-        query = query.filter(ComplexComparison.deal_discount_rate >= min_discount)
-
-    # 정렬
-    sort_column_map = {
-        "deal_discount_rate": ComplexComparison.deal_discount_rate,
-        "kb_price_mid": ComplexComparison.kb_price_mid,
-        "recent_deal_price": ComplexComparison.recent_deal_price,
-        "deal_count_3m": ComplexComparison.deal_count_3m,
-    }
-    sort_col = sort_column_map.get(sort_by, ComplexComparison.deal_discount_rate)
-    if order == "asc":
-        query = query.order_by(asc(sort_col))
+        filters.append(ComplexComparison.deal_discount_rate >= min_discount)
+
+    # 정렬 (미리 만들어 둔 ORDER BY 절 사용)
+    # 알 수 없는 정렬 기준은 할인율, asc가 아닌 방향은 desc로 처리
+    if sort_by not in SORT_COLUMN_MAP:
+        sort_by = "deal_discount_rate"
+    order_clause = _ORDER_CLAUSES[(sort_by, "asc" if order == "asc" else "desc")]
+
+    # 전체 건수: 단지 목록 COUNT는 조인 전체를 훑으므로 가능한 한 재실행하지 않음
+    # - 지역 필터만 있으면 플래너 예상 행 수 사용 (작은 결과는 정확히 계산)
+    # - 그 외 필터는 첫 페이지에서 계산한 값을 Redis에 두고 다음 페이지에서 재사용
+    count_stmt = (
+        select(ComplexComparison.id)
+        .join(ApartmentComplex, ComplexComparison.complex_id == ApartmentComplex.id)
+        .where(*filters)
+    )
+    region_only = not name and min_discount is None
+    total_key = cache_service.list_total_key({
+        "sido": sido, "sigungu": sigungu, "name": name, "min_discount": min_discount,
+    })
+    total = None
+    if region_only:
+        estimated = await estimate_count(db, count_stmt)
+        if estimated is not None and estimated >= ESTIMATE_COUNT_MIN_ROWS:
+            total = estimated
+    elif offset > 0:
+        total = await cache_service.get_int(total_key)
+
+    # ComplexComparison JOIN ApartmentComplex — 응답에 필요한 컬럼만 조회 (ORM 엔티티 생성 생략)
+    # 건수를 아직 모르면 윈도우 함수로 같은 쿼리에서 함께 조회 (count + 목록 2회 실행 방지)
+    # lambda_stmt: 같은 형태의 요청은 SELECT 구성/컴파일 결과를 재사용 (필터 값은 바인드 파라미터)
+    if total is None:
+        stmt = lambda_stmt(lambda: select(*LIST_COLUMNS, func.count().over().label("total")))
     else:
-        query = query.order_by(desc(sort_col))
-
-    total = query.count()
-    rows = query.offset(offset).limit(limit).all()
-
-    items = []
-    for comp, cpx in rows:
-        items.append(ComplexListItem(
-            complex_id=cpx.id,
-            name=cpx.name,
-            sido=cpx.sido,
-            sigungu=cpx.sigungu,
-            dong=cpx.dong,
-            built_year=cpx.built_year,
-            total_units=cpx.total_units,
-            area_sqm=comp.area_sqm,
-            kb_price_mid=comp.kb_price_mid,
-            recent_deal_price=comp.recent_deal_price,
-            recent_deal_date=comp.recent_deal_date,
-            deal_discount_rate=comp.deal_discount_rate,
-            deal_count_3m=comp.deal_count_3m,
-            compared_at=comp.compared_at,
-        ))
+        stmt = lambda_stmt(lambda: select(*LIST_COLUMNS))
+    stmt += lambda s: (
+        s.join(ApartmentComplex, ComplexComparison.complex_id == ApartmentComplex.id)
+        .where(*filters)
+        .order_by(order_clause)
+        .offset(offset)
+        .limit(limit)
+    )
+
+    rows = (await db.execute(stmt)).mappings().all()
+    if total is None:
+        if rows:
+            total = rows[0]["total"]
+        elif offset > 0:
+            # 범위를 벗어난 페이지: 윈도우 결과가 없으므로 건수만 별도 조회
+            total = await db.scalar(
+                select(func.count()).select_from(count_stmt.subquery())
+            ) or 0
+        else:
+            total = 0
+        if not region_only:
+            await cache_service.set_int(total_key, total, ttl=cache_service.LIST_TOTAL_TTL)
+
+    # 컬럼 라벨이 스키마 필드명과 같고 DB 타입도 일치하므로 검증 없이 바로 조립
+    # ("total" 키는 스키마에 없는 필드라 무시됨)
+    items = [ComplexListItem.model_construct(**row) for row in rows]
 
     return ComplexListResponse(total=total, items=items)
 
@@ -1,6 +1,7 @@
 """대시보드 API 라우터
 
 크롤링 현황, 스케줄러 상태, 지역별 통계를 제공합니다.
+대시보드 첫 화면은 /bootstrap 한 번으로 세 가지를 함께 받습니다.
 (네이버 매물 제거 후 KB시세 + 실거래가 + 단지비교 기반)
 """
 
@@ -8,13 +9,15 @@ import logging
 
 from fastapi import APIRouter, Depends
 from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.database import get_db
+from app.models.database import get_async_db
+from app.services import cache_service
 from app.models.apartment import (
     ApartmentComplex, KBPrice, RealTransaction, ComplexComparison,
 )
 from app.schemas.dashboard import (
+    DashboardBootstrapResponse,
     DBSummaryResponse,
     SchedulerStatusResponse,
     SchedulerJobInfo,
@@ -28,29 +31,47 @@ router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
 
 @router.get("/summary", response_model=DBSummaryResponse)
-def get_summary(db: Session = Depends(get_db)):
-    """DB 요약 통계를 반환합니다."""
-    total_complexes = db.query(func.count(ApartmentComplex.id)).scalar() or 0
-    kb_prices_count = db.query(func.count(KBPrice.id)).scalar() or 0
-    real_transactions_count = db.query(func.count(RealTransaction.id)).scalar() or 0
-    comparisons_count = db.query(func.count(ComplexComparison.id)).scalar() or 0
+async def get_summary(db: AsyncSession = Depends(get_async_db)):
+    """DB 요약 통계를 반환합니다 (크롤러 갱신 전까지 캐시)."""
+    return await cache_service.cached_json(
+        cache_service.DASH_SUMMARY_KEY, lambda: _load_summary(db),
+    )
 
-    # 급매: deal_discount_rate > 0 → 실거래가가 KB시세보다 낮게 거래된 단지/면적
-    bargains_count = db.query(func.count(ComplexComparison.id)).filter(
-        ComplexComparison.deal_discount_rate > 0
-    ).scalar() or 0
 
-    last_kb_update = db.query(func.max(KBPrice.updated_at)).scalar()
-    last_transaction_update = db.query(func.max(RealTransaction.created_at)).scalar()
+async def _load_summary(db: AsyncSession) -> DBSummaryResponse:
+    """DB 요약 통계를 조회합니다.
+
+    건수/최근 갱신 시각을 스칼라 서브쿼리로 묶어 한 번의 왕복으로 가져온다.
+    (하나의 AsyncSession에서는 쿼리를 동시에 실행할 수 없으므로 gather 대신 단일 쿼리)
+    """
+    stmt = select(
+        select(func.count(ApartmentComplex.id))
+        .scalar_subquery().label("total_complexes"),
+        select(func.count(KBPrice.id))
+        .scalar_subquery().label("kb_prices_count"),
+        select(func.count(RealTransaction.id))
+        .scalar_subquery().label("real_transactions_count"),
+        select(func.count(ComplexComparison.id))
+        .scalar_subquery().label("comparisons_count"),
+        # 급매: deal_discount_rate > 0 → 실거래가가 KB시세보다 낮게 거래된 단지/면적
+        select(func.count(ComplexComparison.id))
+        .where(ComplexComparison.deal_discount_rate > 0)
+        .scalar_subquery().label("bargains_count"),
+        select(func.max(KBPrice.updated_at))
+        .scalar_subquery().label("last_kb_update"),
+        select(func.max(RealTransaction.created_at))
+        .scalar_subquery().label("last_transaction_update"),
+    )
+    row = (await db.execute(stmt)).one()
 
     return DBSummaryResponse(
-        total_complexes=total_complexes,
-        kb_prices_count=kb_prices_count,
-        real_transactions_count=real_transactions_count,
-        comparisons_count=comparisons_count,
-        bargains_count=bargains_count,
-        last_kb_update=last_kb_update,
-        last_transaction_update=last_transaction_update,
+        total_complexes=row.total_complexes or 0,
+        kb_prices_count=row.kb_prices_count or 0,
+        real_transactions_count=row.real_transactions_count or 0,
+        comparisons_count=row.comparisons_count or 0,
+        bargains_count=row.bargains_count or 0,
+        last_kb_update=row.last_kb_update,
+        last_transaction_update=row.last_transaction_update,
     )
 
 
@@ -82,60 +103,81 @@ def get_scheduler_status():
 
 
 @router.get("/regions", response_model=RegionBreakdownResponse)
-def get_region_breakdown(db: Session = Depends(get_db)):
-    """지역별 통계를 반환합니다."""
+async def get_region_breakdown(db: AsyncSession = Depends(get_async_db)):
+    """지역별 통계를 반환합니다 (크롤러 갱신 전까지 캐시)."""
+    return await cache_service.cached_json(
+        cache_service.DASH_REGIONS_KEY, lambda: _load_region_breakdown(db),
+    )
+
+
+async def _load_region_breakdown(db: AsyncSession) -> RegionBreakdownResponse:
+    """지역별 통계를 조회합니다.
+
+    지역마다 건수 쿼리를 반복하지 않도록, 하위 테이블 건수를 단지별로 먼저
+    집계한 뒤 (sido, sigungu) 단위로 한 번에 합산한다.
+    """
 
-    # 지역별 단지 수
-    complex_stats = (
-        db.query(
+    # 단지별 하위 테이블 건수 (JOIN 시 행 폭증 방지를 위해 미리 집계)
+    def _count_by_complex(model):
+        return (
+            select(model.complex_id, func.count(model.id).label("cnt"))
+            .group_by(model.complex_id)
+            .subquery()
+        )
+
+    kb_counts = _count_by_complex(KBPrice)
+    deal_counts = _count_by_complex(RealTransaction)
+    comparison_counts = _count_by_complex(ComplexComparison)
+
+    stmt = (
+        select(
             ApartmentComplex.sido,
             ApartmentComplex.sigungu,
             func.count(ApartmentComplex.id).label("complex_count"),
+            func.coalesce(func.sum(kb_counts.c.cnt), 0).label("kb_price_count"),
+            func.coalesce(func.sum(deal_counts.c.cnt), 0).label("deal_count"),
+            func.coalesce(func.sum(comparison_counts.c.cnt), 0).label("comparison_count"),
             func.max(ApartmentComplex.updated_at).label("latest_update"),
         )
+        .outerjoin(kb_counts, kb_counts.c.complex_id == ApartmentComplex.id)
+        .outerjoin(deal_counts, deal_counts.c.complex_id == ApartmentComplex.id)
+        .outerjoin(comparison_counts, comparison_counts.c.complex_id == ApartmentComplex.id)
         .group_by(ApartmentComplex.sido, ApartmentComplex.sigungu)
-        .all()
+        # 시/도 → 시/군/구 순 정렬
+        .order_by(ApartmentComplex.sido, ApartmentComplex.sigungu)
     )
+    rows = (await db.execute(stmt)).all()
 
-    items = []
-    for row in complex_stats:
-        sido = row.sido
-        sigungu = row.sigungu
-
-        # 해당 지역 단지 ID 서브쿼리
-        complex_ids_q = select(ApartmentComplex.id).where(
-            ApartmentComplex.sido == sido, ApartmentComplex.sigungu == sigungu
-        )
-
-        # KB시세 건수
-        kb_count = db.query(func.count(KBPrice.id)).filter(
-            KBPrice.complex_id.in_(complex_ids_q),
-        ).scalar() or 0
-
-        # 실거래 건수
-        deal_count = db.query(func.count(RealTransaction.id)).filter(
-            RealTransaction.complex_id.in_(complex_ids_q),
-        ).scalar() or 0
-
-        # 단지 비교 건수
-        comparison_count = db.query(func.count(ComplexComparison.id)).filter(
-            ComplexComparison.complex_id.in_(complex_ids_q),
-        ).scalar() or 0
-
-        items.append(RegionStatItem(
-            sido=sido,
-            sigungu=sigungu,
+    items = [
+        RegionStatItem(
+            sido=row.sido,
+            sigungu=row.sigungu,
             complex_count=row.complex_count,
-            kb_price_count=kb_count,
-            deal_count=deal_count,
-            comparison_count=comparison_count,
+            kb_price_count=row.kb_price_count,
+            deal_count=row.deal_count,
+            comparison_count=row.comparison_count,
             latest_update=row.latest_update,
-        ))
-
-    # 시/도 → 시/군/구 순 정렬
-    items.sort(key=lambda x: (x.sido, x.sigungu))
+        )
+        for row in rows
+    ]
 
     return RegionBreakdownResponse(
         total_regions=len(items),
         items=items,
     )
+
+
+@router.get("/bootstrap", response_model=DashboardBootstrapResponse)
+async def get_bootstrap(db: AsyncSession = Depends(get_async_db)):
+    """대시보드 초기 데이터(요약, 스케줄러, 지역별 통계)를 한 번에 반환합니다.
+
+    같은 세션에서 순서대로 조회한다 (AsyncSession은 동시 쿼리 불가).
+    각 항목의 캐시는 개별 엔드포인트와 공유한다.
+    """
+    summary = await get_summary(db)
+    regions = await get_region_breakdown(db)
+    return DashboardBootstrapResponse(
+        summary=summary,
+        scheduler=get_scheduler_status(),
+        regions=regions,
+    )
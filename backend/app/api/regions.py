@@ -2,11 +2,13 @@
 
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.models.database import get_db
-from app.models.apartment import ApartmentComplex
+from app.models.database import get_async_db
+from app.models.region import region_source
+from app.services import cache_service
 
 
 class RegionResponse(BaseModel):
@@ -17,34 +19,40 @@ router = APIRouter(prefix="/api/regions", tags=["regions"])
 
 
 @router.get("/sido", response_model=RegionResponse, summary="시/도 목록 조회")
-def get_sido_list(db: Session = Depends(get_db)):
+async def get_sido_list(db: AsyncSession = Depends(get_async_db)):
     """
     DB에 등록된 아파트 단지 기준으로 시/도 목록을 반환합니다.
     """
-    rows = (
-        db.query(ApartmentComplex.sido)
-        .distinct()
-        .order_by(ApartmentComplex.sido)
-        .all()
-    )
-    regions = [row[0] for row in rows]
-    return RegionResponse(regions=regions)
+    async def _load():
+        regions_t = region_source()
+        stmt = (
+            select(regions_t.c.sido)
+            .distinct()
+            .order_by(regions_t.c.sido)
+        )
+        regions = list((await db.scalars(stmt)).all())
+        return RegionResponse(regions=regions)
+
+    return await cache_service.cached_json(cache_service.SIDO_KEY, _load)
 
 
 @router.get("/sigungu", response_model=RegionResponse, summary="시/군/구 목록 조회")
-def get_sigungu_list(
+async def get_sigungu_list(
     sido: str = Query(..., description="시/도 이름 (예: 서울특별시)"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     선택된 시/도에 속하는 시/군/구 목록을 반환합니다.
     """
-    rows = (
-        db.query(ApartmentComplex.sigungu)
-        .filter(ApartmentComplex.sido == sido)
-        .distinct()
-        .order_by(ApartmentComplex.sigungu)
-        .all()
-    )
-    regions = [row[0] for row in rows]
-    return RegionResponse(regions=regions)
+    async def _load():
+        regions_t = region_source()
+        stmt = (
+            select(regions_t.c.sigungu)
+            .where(regions_t.c.sido == sido)
+            .distinct()
+            .order_by(regions_t.c.sigungu)
+        )
+        regions = list((await db.scalars(stmt)).all())
+        return RegionResponse(regions=regions)
+
+    return await cache_service.cached_json(cache_service.sigungu_key(sido), _load)
@@ -6,15 +6,19 @@
 - POST /api/transactions/collect: 특정 지역/기간의 실거래가 수집 실행
 """
 
+import re
 from datetime import datetime
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.models.database import get_db
+from app.models.database import get_async_db, get_db
 from app.models.apartment import ApartmentComplex
+from app.services import cache_service
 from app.services.real_transaction_service import (
     collect_and_save,
     get_transactions_by_complex,
@@ -23,6 +27,9 @@ from app.services.real_transaction_service import (
 
 router = APIRouter(prefix="/api/transactions", tags=["transactions"])
 
+# 계약년월 YYYYMM (2006~2030년, 01~12월)
+_DEAL_YMD_RE = re.compile(r"^20(0[6-9]|[12]\d|30)(0[1-9]|1[0-2])$")
+
 
 # ──────────────────────────────────────────
 # 응답 스키마
@@ -37,8 +44,7 @@ class TransactionItem(BaseModel):
     deal_price: int = Field(..., description="거래금액(만원)")
     deal_date: Optional[str] = Field(None, description="거래일자 (ISO 형식)")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TransactionListResponse(BaseModel):
@@ -72,6 +78,16 @@ class CollectRequest(BaseModel):
         max_length=6,
     )
 
+    @field_validator("deal_ymd")
+    @classmethod
+    def _check_deal_ymd(cls, v: str) -> str:
+        """잘못된 계약년월은 핸들러 실행 전에 422로 거절."""
+        if not _DEAL_YMD_RE.match(v):
+            raise ValueError(
+                f"잘못된 계약년월 형식: {v}. YYYYMM 형식이어야 합니다 (예: 202401)."
+            )
+        return v
+
 
 class CollectResponse(BaseModel):
     """실거래가 수집 결과 응답"""
@@ -88,18 +104,33 @@ class CollectResponse(BaseModel):
 # API 엔드포인트
 # ──────────────────────────────────────────
 
+async def _get_complex_name(db: AsyncSession, complex_id: int) -> str:
+    """단지명을 조회한다. 단지가 없으면 404."""
+    name = (
+        await db.execute(
+            select(ApartmentComplex.name).where(ApartmentComplex.id == complex_id)
+        )
+    ).scalar_one_or_none()
+    if name is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"단지를 찾을 수 없습니다: complex_id={complex_id}",
+        )
+    return name
+
+
 @router.get(
     "",
     response_model=TransactionListResponse,
     summary="특정 단지의 최근 실거래가 조회",
 )
-def get_transactions(
+async def get_transactions(
     complex_id: int = Query(..., description="아파트 단지 ID"),
     limit: int = Query(20, ge=1, le=100, description="최대 조회 건수"),
     area_sqm: Optional[float] = Query(
         None, description="전용면적 필터(m2)",
     ),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     특정 아파트 단지의 최근 실거래가 목록을 반환합니다.
@@ -107,24 +138,18 @@ def get_transactions(
     - 최근 거래일 순으로 정렬
     - 전용면적으로 필터링 가능
     """
-    # 단지 존재 여부 확인
-    cpx = db.query(ApartmentComplex).filter(
-        ApartmentComplex.id == complex_id,
-    ).first()
-    if cpx is None:
-        raise HTTPException(
-            status_code=404,
-            detail=f"단지를 찾을 수 없습니다: complex_id={complex_id}",
-        )
+    # 단지 존재 여부 확인 (단지명만 조회)
+    complex_name = await _get_complex_name(db, complex_id)
 
-    items = get_transactions_by_complex(
+    items = await get_transactions_by_complex(
         db, complex_id=complex_id, limit=limit, area_sqm=area_sqm,
     )
 
+    # 서비스에서 스키마 형태(ISO 날짜 문자열 등)로 만든 DB 데이터이므로 재검증 없이 조립
     return TransactionListResponse(
         complex_id=complex_id,
-        complex_name=cpx.name,
-        items=[TransactionItem(**item) for item in items],
+        complex_name=complex_name,
+        items=[TransactionItem.model_construct(**item) for item in items],
         count=len(items),
     )
 
@@ -134,41 +159,42 @@ def get_transactions(
     response_model=TransactionSummaryResponse,
     summary="특정 단지의 실거래가 요약 통계",
 )
-def get_summary(
+async def get_summary(
     complex_id: int = Query(..., description="아파트 단지 ID"),
     area_sqm: Optional[float] = Query(
         None, description="전용면적 필터(m2)",
     ),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     특정 아파트 단지의 실거래가 요약 통계를 반환합니다.
 
     - 총 거래 건수, 최고가, 최저가, 평균가, 최근 거래가
     """
-    # 단지 존재 여부 확인
-    cpx = db.query(ApartmentComplex).filter(
-        ApartmentComplex.id == complex_id,
-    ).first()
-    if cpx is None:
-        raise HTTPException(
-            status_code=404,
-            detail=f"단지를 찾을 수 없습니다: complex_id={complex_id}",
-        )
+    async def _load() -> TransactionSummaryResponse:
+        # 단지 존재 여부 확인 (단지명만 조회)
+        complex_name = await _get_complex_name(db, complex_id)
 
-    summary = get_transaction_summary(
-        db, complex_id=complex_id, area_sqm=area_sqm,
-    )
-    if summary is None:
-        raise HTTPException(
-            status_code=404,
-            detail=f"실거래가 데이터가 없습니다: complex_id={complex_id}",
+        summary = await get_transaction_summary(
+            db, complex_id=complex_id, area_sqm=area_sqm,
+        )
+        if summary is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"실거래가 데이터가 없습니다: complex_id={complex_id}",
+            )
+
+        return TransactionSummaryResponse(
+            complex_id=complex_id,
+            complex_name=complex_name,
+            **summary,
         )
 
-    return TransactionSummaryResponse(
-        complex_id=complex_id,
-        complex_name=cpx.name,
-        **summary,
+    # 실거래 수집 전까지 결과가 같으므로 캐시 (수집 시 무효화)
+    return await cache_service.cached_json(
+        cache_service.tx_summary_key(complex_id, area_sqm),
+        _load,
+        ttl=cache_service.TX_SUMMARY_TTL,
     )
 
 
@@ -192,21 +218,6 @@ async def collect_transactions(
     - 공공데이터포털 일일 트래픽 제한 (1,000건)이 있으므로 과도한 호출에 주의
     - DATA_GO_KR_API_KEY가 .env에 설정되어 있어야 함
     """
-    # deal_ymd 유효성 검사
-    try:
-        year = int(request.deal_ymd[:4])
-        month = int(request.deal_ymd[4:6])
-        if not (2006 <= year <= 2030 and 1 <= month <= 12):
-            raise ValueError
-    except (ValueError, IndexError):
-        raise HTTPException(
-            status_code=400,
-            detail=(
-                f"잘못된 계약년월 형식: {request.deal_ymd}. "
-                "YYYYMM 형식이어야 합니다 (예: 202401)."
-            ),
-        )
-
     result = await collect_and_save(
         db,
         sido=request.sido,
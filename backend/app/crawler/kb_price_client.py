@@ -12,12 +12,22 @@ kbland.kr 프론트엔드가 호출하는 api.kbland.kr 내부 API를 역분석
 """
 
 import asyncio
-import difflib
 import logging
+import random
 import re
-from typing import Any, Dict, List, Optional, Tuple
+import sys
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from urllib.parse import quote
+from typing import Any, Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Tuple
 
 import httpx
+import orjson
+from rapidfuzz import fuzz
+
+from app.crawler.rate_limiter import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +47,20 @@ COMPLEX_TYPE_URL = f"{KB_API_BASE}/land-complex/complex/typInfo"
 # 면적별 KB시세 상세 조회
 PRICE_INFO_URL = f"{KB_API_BASE}/land-price/price/BasePrcInfoNew"
 
+# 쿼리 문자열 템플릿 (한글 파라미터명은 요청마다가 아니라 모듈 로드 시 한 번만 URL 인코딩)
+# 값은 모두 숫자 코드이므로 인코딩 없이 format으로 채움
+_Q_LAWDCD = quote("법정동코드")
+_Q_COMPLEX_ID = quote("단지기본일련번호")
+_Q_AREA_SEQ = quote("면적일련번호")
+_Q_PROPERTY_TYPE = quote("매물종별구분")
+COMPLEX_LIST_QUERY = f"{COMPLEX_LIST_URL}?{_Q_LAWDCD}={{lawdcd}}"
+COMPLEX_BRIF_QUERY = f"{COMPLEX_BRIF_URL}?{_Q_COMPLEX_ID}={{complex_id}}&{_Q_PROPERTY_TYPE}=01"
+COMPLEX_TYPE_QUERY = f"{COMPLEX_TYPE_URL}?{_Q_COMPLEX_ID}={{complex_id}}&{_Q_PROPERTY_TYPE}=01"
+PRICE_INFO_QUERY = (
+    f"{PRICE_INFO_URL}?{_Q_COMPLEX_ID}={{complex_id}}"
+    f"&{_Q_AREA_SEQ}={{area_seq}}&{_Q_PROPERTY_TYPE}=01"
+)
+
 # kbland.kr 프론트엔드 Origin / Referer (CORS 및 접근 제어용)
 DEFAULT_HEADERS = {
     "User-Agent": (
@@ -53,15 +77,84 @@ DEFAULT_HEADERS = {
 # 재시도 설정
 MAX_RETRIES = 3
 RETRY_BACKOFF_BASE = 2.0  # 지수 백오프 기본 초
+RETRY_BACKOFF_MAX = 60.0  # 백오프 최대 대기 초
+
+# dataHeader가 없는 응답용 빈 헤더 (응답마다 빈 dict를 만들지 않음)
+_EMPTY_HEADER: Mapping[str, Any] = MappingProxyType({})
+
+# KB API 호출 한도 (rate limiting)
+# 기존 1.5초 딜레이 x 동시 5개 동 처리와 같은 수준 (~3건/초)
+KB_RATE_PER_SECOND = 3.0
+KB_RATE_BURST = 3
+
+# 한 단지의 면적별 시세를 동시에 조회할 최대 요청 수
+KB_PRICE_CONCURRENCY = 8
+
+# get_prices_for_complexes()에서 동시에 처리할 최대 단지 수
+KB_BATCH_CONCURRENCY = 32
+
+# 단지 목록에서 보관할 필드 (매칭/동 필터/단지번호 조회에 쓰는 것만)
+COMPLEX_LIST_FIELDS = ("단지기본일련번호", "단지명", "주소")
+
+# 단지 목록/면적 타입 캐시 유효 시간 (초) — KB 단지 정보는 하루 단위로도 거의 안 바뀜
+KB_LIST_CACHE_TTL = 3600
+
+# 완전 일치 색인을 보관할 단지 목록 수 (지역 배치에서 여러 동의 매칭이 번갈아 실행돼도 재생성 방지)
+EXACT_INDEX_MAX_LISTS = 64
+
+# 커넥션 풀 (동시 요청 수는 rate limiter가 제한)
+# 요청 간격이 벌어져도 TLS 연결을 다시 맺지 않도록 유휴 연결을 60초간 유지
+KB_HTTP_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=64,
+    keepalive_expiry=60.0,
+)
+KB_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+# 서버 프로세스 전체가 공유하는 KB API 클라이언트 (앱 시작/종료 시 생성/정리)
+# 스크립트처럼 init_kb_client()를 호출하지 않은 경우 인스턴스별 클라이언트를 사용
+_SHARED_CLIENT: Optional[httpx.AsyncClient] = None
+
+# 기본 한도로 생성된 모든 KBPriceClient가 나눠 쓰는 호출 한도
+# (인스턴스마다 버킷을 두면 동시에 여러 작업이 돌 때 IP당 한도를 넘김)
+_SHARED_BUCKET = TokenBucket(rate=KB_RATE_PER_SECOND, capacity=KB_RATE_BURST)
+
+
+def _new_http_client() -> httpx.AsyncClient:
+    """KB API용 AsyncClient 생성 (HTTP/2 + keep-alive)."""
+    return httpx.AsyncClient(
+        headers=DEFAULT_HEADERS,
+        timeout=KB_HTTP_TIMEOUT,
+        limits=KB_HTTP_LIMITS,
+        follow_redirects=True,
+        http2=True,
+    )
+
+
+async def init_kb_client():
+    """공유 KB API 클라이언트를 생성한다 (서버 시작 시 호출).
+
+    스케줄러 작업마다 KBPriceClient를 새로 만들어도 TCP/TLS 연결을 재사용하며,
+    HTTP/2로 한 연결에서 여러 요청을 동시에 보낸다.
+    """
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+        _SHARED_CLIENT = _new_http_client()
+
+
+async def close_kb_client():
+    """공유 KB API 클라이언트를 정리한다 (서버 종료 시 호출)."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is not None:
+        await _SHARED_CLIENT.aclose()
+        _SHARED_CLIENT = None
 
-# KB 시세 딜레이 (rate limiting)
-KB_DELAY_SECONDS = 1.5
 
 # ──────────────────────────────────────────
 # 전국 시/군/구 법정동코드 매핑 (kbland.kr용)
 # 구-level 코드 (fallback용): 5자리 SIGUNGU_CODE + "00000" = 10자리
 # ──────────────────────────────────────────
-LAWDCD_MAP: Dict[str, Dict[str, str]] = {
+LAWDCD_MAP: Mapping[str, Mapping[str, str]] = {
     "서울특별시": {
         "종로구":   "1111000000",
         "중구":     "1114000000",
@@ -187,7 +280,7 @@ LAWDCD_MAP: Dict[str, Dict[str, str]] = {
 # 동-level 법정동코드 매핑
 # KB API(fastPriceComplexName)는 동-level 코드가 필요함
 # ──────────────────────────────────────────
-DONG_LAWDCD_MAP: Dict[str, Dict[str, Dict[str, str]]] = {
+DONG_LAWDCD_MAP: Mapping[str, Mapping[str, Mapping[str, str]]] = {
     "서울특별시": {
         "강남구": {
             "역삼동": "1168010100",
@@ -2553,6 +2646,39 @@ DONG_LAWDCD_MAP: Dict[str, Dict[str, Dict[str, str]]] = {
 }
 
 
+def _freeze(mapping: Dict[str, Any]) -> Mapping[str, Any]:
+    """중첩 dict를 읽기 전용 MappingProxyType으로 감싼다 (지역명 키는 intern)."""
+    return MappingProxyType({
+        sys.intern(key): _freeze(value) if isinstance(value, dict) else value
+        for key, value in mapping.items()
+    })
+
+
+# 실행 중 수정되지 않도록 고정 (편집은 위 리터럴에서)
+LAWDCD_MAP = _freeze(LAWDCD_MAP)
+DONG_LAWDCD_MAP = _freeze(DONG_LAWDCD_MAP)
+
+
+def _build_flat() -> Dict[Tuple[str, str, Optional[str]], str]:
+    """중첩 매핑을 (sido, sigungu, dong) 키 하나로 펼친다 (구-level은 dong=None).
+
+    사람이 편집하는 원본은 LAWDCD_MAP / DONG_LAWDCD_MAP이고,
+    조회는 모듈 로드 시 한 번 만든 평면 dict로 해시 1회에 끝낸다.
+    """
+    flat: Dict[Tuple[str, str, Optional[str]], str] = {}
+    for sido, sigungu_map in LAWDCD_MAP.items():
+        for sigungu, code in sigungu_map.items():
+            flat[(sido, sigungu, None)] = code
+    for sido, sigungu_map in DONG_LAWDCD_MAP.items():
+        for sigungu, dong_map in sigungu_map.items():
+            for dong, code in dong_map.items():
+                flat[(sido, sigungu, dong)] = code
+    return flat
+
+
+_FLAT_LAWDCD: Mapping[Tuple[str, str, Optional[str]], str] = MappingProxyType(_build_flat())
+
+
 def get_lawdcd(
     sido: str,
     sigungu: str,
@@ -2572,19 +2698,18 @@ def get_lawdcd(
         10자리 법정동코드 문자열, 없으면 None
     """
     if dong:
-        dong_map = DONG_LAWDCD_MAP.get(sido, {}).get(sigungu, {})
-        code = dong_map.get(dong)
+        code = _FLAT_LAWDCD.get((sido, sigungu, dong))
         if code:
             return code
     # fallback: 구-level 코드
-    return LAWDCD_MAP.get(sido, {}).get(sigungu)
+    return _FLAT_LAWDCD.get((sido, sigungu, None))
 
 
 class KBPriceClient:
     """KB부동산 내부 API를 호출하는 HTTP 클라이언트.
 
     - httpx.AsyncClient 사용 (비동기 HTTP 요청)
-    - 요청 간 딜레이(rate limiting) 준수
+    - 토큰 버킷으로 호출 속도 제한 (rate limiting)
     - 에러 발생 시 지수 백오프 재시도
     - kbland.kr 프론트엔드 요청을 모사하는 헤더 설정
     """
@@ -2592,32 +2717,47 @@ class KBPriceClient:
     def __init__(self, delay: Optional[float] = None):
         """
         Args:
-            delay: 요청 간 딜레이(초). None이면 기본값(KB_DELAY_SECONDS) 사용
+            delay: 요청 간 최소 간격(초, 0보다 커야 함).
+                   None이면 프로세스 공통 기본 한도(KB_RATE_PER_SECOND) 사용
+
+        Raises:
+            ValueError: delay가 0 이하인 경우
         """
         self._client: Optional[httpx.AsyncClient] = None
-        self._delay = delay if delay is not None else KB_DELAY_SECONDS
+        if delay is not None:
+            if delay <= 0:
+                raise ValueError("delay는 0보다 커야 합니다")
+            self._bucket = TokenBucket(rate=1 / delay)
+        else:
+            self._bucket = _SHARED_BUCKET
         # 5자리 시군구코드 조회 결과 캐시 (경기도 등 10자리 미지원 지역용)
         self._sigungu_cache: Dict[str, List[Dict[str, Any]]] = {}
+        # 법정동코드별 단지 목록 / 단지별 면적 타입 캐시: key → (저장 시각, 결과)
+        self._complex_list_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._types_cache: Dict[int, Tuple[float, List[Dict[str, Any]]]] = {}
+        # 면적별 시세 동시 조회 제한 (이벤트 루프 안에서 lazy 생성)
+        self._price_sem: Optional[asyncio.Semaphore] = None
+        # 단지 목록별 정규화명 → 첫 단지 색인 (완전 일치 즉시 반환용, 최근 목록 LRU)
+        # id(목록) → (목록, 색인). 목록 객체를 함께 보관해 id 재사용 방지
+        self._exact_indexes: OrderedDict = OrderedDict()
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """lazy-init으로 AsyncClient 생성."""
+        """공유 클라이언트가 있으면 사용, 없으면 lazy-init으로 AsyncClient 생성."""
+        if _SHARED_CLIENT is not None and not _SHARED_CLIENT.is_closed:
+            return _SHARED_CLIENT
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                headers=DEFAULT_HEADERS,
-                timeout=httpx.Timeout(30.0, connect=10.0),
-                follow_redirects=True,
-            )
+            self._client = _new_http_client()
         return self._client
 
     async def close(self):
-        """클라이언트 리소스 정리."""
+        """클라이언트 리소스 정리 (공유 클라이언트는 close_kb_client()에서 정리)."""
         if self._client and not self._client.is_closed:
             await self._client.aclose()
             self._client = None
 
     async def _throttle(self):
-        """요청 간 딜레이 적용 (rate limiting)."""
-        await asyncio.sleep(self._delay)
+        """호출 한도 적용 (토큰 버킷, 한도 내 요청은 동시에 진행)."""
+        await self._bucket.acquire()
 
     async def _request(
         self,
@@ -2640,21 +2780,26 @@ class KBPriceClient:
                 response = await client.get(url, params=params)
 
                 if response.status_code == 200:
-                    data = response.json()
-                    header = data.get("dataHeader", {})
+                    # bytes를 바로 파싱 (str 디코딩 + stdlib json 생략)
+                    data = orjson.loads(response.content)
+                    header = data.get("dataHeader") or _EMPTY_HEADER
+                    result_code = header.get("resultCode")
                     # resultCode "10000" = 정상
-                    if header.get("resultCode") == "10000":
-                        return data.get("dataBody")
-                    else:
+                    if result_code != "10000":
                         logger.warning(
                             "KB API 비정상 응답: %s (code=%s)",
                             header.get("message", "?"),
-                            header.get("resultCode", "?"),
+                            result_code or "?",
                         )
-                        return data.get("dataBody")
+                    return data.get("dataBody")
 
                 if response.status_code == 429:
-                    wait = RETRY_BACKOFF_BASE ** attempt * 2
+                    # full jitter: 동시에 막힌 요청들이 같은 시각에 재시도하지 않도록 분산
+                    # 서버가 Retry-After를 주면 그보다 일찍 재시도하지 않음
+                    wait = random.uniform(
+                        0, min(RETRY_BACKOFF_BASE ** attempt * 2, RETRY_BACKOFF_MAX),
+                    )
+                    wait = max(_retry_after_seconds(response), wait)
                     logger.warning(
                         "KB API Rate limited. %.1f초 후 재시도 (%d/%d)",
                         wait, attempt, MAX_RETRIES,
@@ -2676,12 +2821,16 @@ class KBPriceClient:
 
             except httpx.TimeoutException:
                 logger.warning("KB API 타임아웃 (%d/%d)", attempt, MAX_RETRIES)
+            except orjson.JSONDecodeError:
+                logger.warning("KB API JSON 파싱 실패 (%d/%d)", attempt, MAX_RETRIES)
             except httpx.HTTPError as e:
-                logger.warning("KB API 에러: %s (%d/%d)", str(e), attempt, MAX_RETRIES)
+                logger.warning("KB API 에러: %s (%d/%d)", e, attempt, MAX_RETRIES)
 
-            # 지수 백오프 대기
+            # 지수 백오프 대기 (full jitter)
             if attempt < MAX_RETRIES:
-                wait = RETRY_BACKOFF_BASE ** attempt
+                wait = random.uniform(
+                    0, min(RETRY_BACKOFF_BASE ** attempt, RETRY_BACKOFF_MAX),
+                )
                 await asyncio.sleep(wait)
 
         logger.error("KB API 최대 재시도 횟수 초과: %s", url)
@@ -2706,13 +2855,39 @@ class KBPriceClient:
         Returns:
             단지 목록 리스트 (단지기본일련번호, 단지명, 주소 등 포함)
         """
+        # 같은 동의 단지를 연달아 매칭할 때 목록 재조회 방지
+        cached = _cache_get(self._complex_list_cache, lawdcd)
+        if cached is not None:
+            return cached
+
+        # 이전 크롤링 실행에서 받아둔 목록 (Redis, 호출 한도 소모 없음)
+        # app.services가 이 모듈을 import하므로 순환 import 방지를 위해 지연 import
+        from app.services import cache_service
+
+        redis_key = cache_service.kb_complex_list_key(lawdcd)
+        result = await cache_service.get_json(redis_key)
+        if not result:
+            result = await self._fetch_complex_list(lawdcd)
+            if result:
+                await cache_service.set_json(
+                    redis_key, result, ttl=cache_service.KB_META_TTL,
+                )
+        if result:
+            self._complex_list_cache[lawdcd] = (time.monotonic(), result)
+        return result
+
+    async def _fetch_complex_list(
+        self,
+        lawdcd: str,
+    ) -> List[Dict[str, Any]]:
+        """단지 목록 API 호출 (10자리 → 5자리 fallback)."""
         await self._throttle()
-        body = await self._request(COMPLEX_LIST_URL, params={"법정동코드": lawdcd})
+        body = await self._request(COMPLEX_LIST_QUERY.format(lawdcd=lawdcd))
 
         if body and isinstance(body, dict):
             data = body.get("data", [])
             if data:
-                return data
+                return _compact_complexes(data)
 
         # 10자리 법정동코드로 결과 없음 → 5자리 시군구코드로 fallback
         # 경기도(41xx) 등 일부 지역은 10자리 코드를 지원하지 않음
@@ -2725,9 +2900,9 @@ class KBPriceClient:
 
             logger.info("10자리 결과 없음, 5자리 fallback: %s → %s", lawdcd, sigungu_code)
             await self._throttle()
-            body = await self._request(COMPLEX_LIST_URL, params={"법정동코드": sigungu_code})
+            body = await self._request(COMPLEX_LIST_QUERY.format(lawdcd=sigungu_code))
             if body and isinstance(body, dict):
-                result = body.get("data", [])
+                result = _compact_complexes(body.get("data", []))
                 self._sigungu_cache[sigungu_code] = result
                 return result
 
@@ -2752,10 +2927,7 @@ class KBPriceClient:
             단지 간략 정보 dict, 실패 시 None
         """
         await self._throttle()
-        body = await self._request(
-            COMPLEX_BRIF_URL,
-            params={"단지기본일련번호": str(complex_id), "매물종별구분": "01"},
-        )
+        body = await self._request(COMPLEX_BRIF_QUERY.format(complex_id=complex_id))
 
         if body and isinstance(body, dict):
             return body.get("data")
@@ -2780,15 +2952,28 @@ class KBPriceClient:
         Returns:
             면적 타입 리스트
         """
-        await self._throttle()
-        body = await self._request(
-            COMPLEX_TYPE_URL,
-            params={"단지기본일련번호": str(complex_id), "매물종별구분": "01"},
-        )
+        cached = _cache_get(self._types_cache, complex_id)
+        if cached is not None:
+            return cached
 
-        if body and isinstance(body, dict):
-            return body.get("data", [])
-        return []
+        from app.services import cache_service
+
+        redis_key = cache_service.kb_types_key(complex_id)
+        types = await cache_service.get_json(redis_key)
+        if not types:
+            await self._throttle()
+            body = await self._request(COMPLEX_TYPE_QUERY.format(complex_id=complex_id))
+            if not body or not isinstance(body, dict):
+                return []
+            types = body.get("data", [])
+            if types:
+                await cache_service.set_json(
+                    redis_key, types, ttl=cache_service.KB_META_TTL,
+                )
+
+        if types:
+            self._types_cache[complex_id] = (time.monotonic(), types)
+        return types
 
     # ──────────────────────────────────────────
     # 면적별 KB시세 상세 조회
@@ -2812,12 +2997,7 @@ class KBPriceClient:
         """
         await self._throttle()
         body = await self._request(
-            PRICE_INFO_URL,
-            params={
-                "단지기본일련번호": str(complex_id),
-                "면적일련번호": str(area_seq),
-                "매물종별구분": "01",
-            },
+            PRICE_INFO_QUERY.format(complex_id=complex_id, area_seq=area_seq),
         )
 
         if body and isinstance(body, dict):
@@ -2839,7 +3019,7 @@ class KBPriceClient:
         """KB 단지번호로 모든 면적의 KB시세를 한번에 조회한다.
 
         1) 면적 타입 목록 조회
-        2) 매매건수가 있는 면적별로 시세 조회
+        2) 면적별 시세 동시 조회 (같은 면적의 타입은 하나만 사용)
         3) 정규화된 시세 리스트 반환
 
         Args:
@@ -2854,10 +3034,9 @@ class KBPriceClient:
             logger.warning("KB 면적 타입 조회 실패: complex_id=%d", complex_id)
             return []
 
-        results = []
-        # 이미 조회한 면적 중복 방지 (동일 면적이 여러 타입으로 존재)
-        seen_areas = set()
-
+        # 동일 면적이 여러 타입으로 존재 → 면적(소수점 1자리)별로 타입을 묶음
+        # (한 타입의 시세가 없으면 같은 면적의 다음 타입으로 재시도)
+        area_groups: Dict[float, List[Tuple[int, float]]] = {}
         for typ in types:
             area_seq = typ.get("면적일련번호")
             area_sqm_str = typ.get("전용면적", "")
@@ -2869,13 +3048,45 @@ class KBPriceClient:
             except (ValueError, TypeError):
                 continue
 
-            # 동일 면적 중복 스킵 (소수점 1자리로 반올림하여 비교)
             area_key = round(area_sqm, 1)
-            if area_key in seen_areas:
-                continue
+            area_groups.setdefault(area_key, []).append((area_seq, area_sqm))
+
+        # 2단계: 면적별 시세 동시 조회
+        # (동시 요청 수는 KB_PRICE_CONCURRENCY, 호출 속도는 rate limiter가 제한)
+        fetched = await asyncio.gather(*(
+            self._get_price_for_area_group(complex_id, candidates)
+            for candidates in area_groups.values()
+        ))
+        results = [r for r in fetched if r is not None]
+
+        for r in results:
+            logger.info(
+                "KB시세: %d | %.1f㎡ | 일반=%s 상한=%s 하한=%s",
+                complex_id, r["area_sqm"], r["price_mid"], r["price_upper"], r["price_lower"],
+            )
+
+        return results
+
+    async def _get_price_for_area_group(
+        self,
+        complex_id: int,
+        candidates: List[Tuple[int, float]],
+    ) -> Optional[Dict[str, Any]]:
+        """같은 면적의 타입들을 순서대로 조회해 첫 유효 시세를 반환한다.
 
-            # 2단계: 면적별 시세 조회
-            price_data = await self.get_price_by_area(complex_id, area_seq)
+        Args:
+            complex_id: KB 단지기본일련번호
+            candidates: [(면적일련번호, 전용면적), ...]
+
+        Returns:
+            {area_sqm, price_lower, price_mid, price_upper}, 없으면 None
+        """
+        if self._price_sem is None:
+            self._price_sem = asyncio.Semaphore(KB_PRICE_CONCURRENCY)
+
+        for area_seq, area_sqm in candidates:
+            async with self._price_sem:
+                price_data = await self.get_price_by_area(complex_id, area_seq)
             if not price_data:
                 continue
 
@@ -2890,20 +3101,13 @@ class KBPriceClient:
             if price_mid is None:
                 continue
 
-            seen_areas.add(area_key)
-            results.append({
+            return {
                 "area_sqm": area_sqm,
                 "price_lower": price_lower,
                 "price_mid": price_mid,
                 "price_upper": price_upper,
-            })
-
-            logger.info(
-                "KB시세: %d | %.1f㎡ | 일반=%s 상한=%s 하한=%s",
-                complex_id, area_sqm, price_mid, price_upper, price_lower,
-            )
-
-        return results
+            }
+        return None
 
     # ──────────────────────────────────────────
     # 네이버 부동산 단지와 KB 단지 매칭
@@ -2959,6 +3163,48 @@ class KBPriceClient:
         prices = await self.get_all_prices(int(kb_id))
         return str(kb_id), prices
 
+    async def get_prices_for_complexes(
+        self,
+        targets: List[Dict[str, Any]],
+        concurrency: int = KB_BATCH_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Tuple[Optional[str], List[Dict[str, Any]]]]:
+        """여러 단지를 동시에 매칭하고 시세를 조회한다.
+
+        같은 법정동의 단지들이 단지 목록을 중복 조회하지 않도록,
+        법정동코드별 목록을 먼저 한 번씩 받아 캐시에 올린 뒤 단지별로 병렬 처리한다.
+        (전체 호출 속도는 토큰 버킷이 제한)
+
+        Args:
+            targets: get_prices_for_complex() 키워드 인자 dict 리스트
+                     (complex_name 필수, sido/sigungu/dong/dong_code 선택)
+            concurrency: 동시에 처리할 최대 단지 수
+            return_exceptions: True면 단지별 예외를 결과 자리에 담아 반환
+                               (한 단지 실패가 나머지 결과를 버리지 않게)
+
+        Returns:
+            targets 순서대로 (kb_complex_id, 면적별 시세 리스트) 튜플 리스트
+        """
+        lawdcds = {
+            t.get("dong_code") or get_lawdcd(
+                t.get("sido", "서울특별시"), t.get("sigungu", ""), t.get("dong"),
+            )
+            for t in targets
+        }
+        await asyncio.gather(*(
+            self.get_complex_list(lawdcd) for lawdcd in lawdcds if lawdcd
+        ))
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(target: Dict[str, Any]):
+            async with semaphore:
+                return await self.get_prices_for_complex(**target)
+
+        return await asyncio.gather(
+            *(_one(t) for t in targets), return_exceptions=return_exceptions,
+        )
+
     # ──────────────────────────────────────────
     # 네이버 부동산 단지와 KB 단지 매칭
     # ──────────────────────────────────────────
@@ -3020,13 +3266,26 @@ class KBPriceClient:
         best_match = None
         best_score = 0
 
-        for cx in candidates:
-            kb_name = cx.get("단지명", "")
-            clean_kb = _normalize_name(kb_name)
-            score = _calc_match_score(clean_target, clean_kb)
-            if score > best_score:
-                best_score = score
-                best_match = cx
+        # 완전 일치(100점)는 dict 조회로 먼저 확인
+        # 동 필터로 후보가 줄었으면 해당 단지가 필터를 통과하는 경우에만 사용
+        exact = self._lookup_exact(kb_complexes, clean_target)
+        if exact is not None and (
+            candidates is kb_complexes
+            or _dong_keyword(dong) in (exact.get("주소", "") or "")
+        ):
+            best_match = exact
+            best_score = 100
+        else:
+            for cx in candidates:
+                kb_name = cx.get("단지명", "")
+                clean_kb = _normalize_name(kb_name)
+                score = _calc_match_score(clean_target, clean_kb)
+                if score > best_score:
+                    best_score = score
+                    best_match = cx
+                    # 완전 일치보다 높은 점수는 없으므로 나머지 후보 생략
+                    if score == 100:
+                        break
 
         # threshold 55: Level 5(fuzzy) 40~54점은 false positive 방지 위해 의도적으로 제외
         if best_match and best_score >= 55:
@@ -3065,11 +3324,149 @@ class KBPriceClient:
 
         return None
 
+    def _lookup_exact(
+        self,
+        kb_complexes: List[Dict[str, Any]],
+        clean_target: str,
+    ) -> Optional[Dict[str, Any]]:
+        """정규화명이 완전히 같은 첫 단지를 찾는다.
+
+        단지 목록 객체별로 색인을 한 번만 만들어 최근 EXACT_INDEX_MAX_LISTS개를 보관한다.
+        (여러 동의 매칭이 번갈아 실행되는 지역 배치에서도 목록마다 재생성하지 않음)
+        """
+        if not clean_target:
+            return None
+        key = id(kb_complexes)
+        entry = self._exact_indexes.get(key)
+        if entry is not None and entry[0] is kb_complexes:
+            self._exact_indexes.move_to_end(key)
+            index = entry[1]
+        else:
+            index = {}
+            for cx in kb_complexes:
+                index.setdefault(_normalize_name(cx.get("단지명", "")), cx)
+            self._exact_indexes[key] = (kb_complexes, index)
+            if len(self._exact_indexes) > EXACT_INDEX_MAX_LISTS:
+                self._exact_indexes.popitem(last=False)
+        return index.get(clean_target)
+
 
 # ──────────────────────────────────────────
 # 내부 헬퍼 함수들
 # ──────────────────────────────────────────
 
+# 정규식은 모듈 로드 시 한 번만 컴파일 (매칭 루프에서 반복 호출됨)
+_RE_PAREN_DANJI = re.compile(r"\((\d+단지)\)")
+_RE_PAREN_CHA = re.compile(r"\((\d+차)\)")
+_RE_PAREN = re.compile(r"\([^)]*\)")
+_RE_APT_SUFFIX = re.compile(r"아파트$")
+_RE_APT = re.compile(r"아파트")
+_RE_NON_WORD = re.compile(r"[^\w가-힣]")
+_RE_NON_WORD_KEEP_DIGIT = re.compile(r"[^\w가-힣0-9]")
+_RE_DANJI_NUM = re.compile(r"\d+단지")
+_RE_CHA_NUM = re.compile(r"\d+차")
+_RE_BLOCK_NUM = re.compile(r"\d+블록")
+_RE_BL_NUM = re.compile(r"\d+BL", re.IGNORECASE)
+_RE_E_PYEONHAN = re.compile(r"(?i)e-?편한세상")
+_RE_NAME_TOKENS = re.compile(r"[가-힣]{2,}|\d+(?:단지|차)?")
+
+# 영문 단어 → 한글 (긴/복합 패턴부터 처리)
+_BRAND_WORD_MAP = [
+    # 복합 브랜드명 (먼저 처리해야 개별 단어 치환과 충돌 방지)
+    (r"(?i)I[\-\s]?PARK", "아이파크"),   # I-PARK, IPARK, I PARK
+    (r"(?i)I[\-\s]?Class", "아이클래스"), # I-Class, IClass
+    (r"(?i)TOP[\-\s]?Class", "탑클래스"), # TOP-Class, TOPClass
+    # 일반 영문 단어 (긴 것부터)
+    (r"(?i)VILLAGE", "빌리지"),
+    (r"(?i)PALACE", "팰리스"),
+    (r"(?i)CLASSIC", "클래식"),
+    (r"(?i)CLASS", "클래스"),
+    (r"(?i)HOUSE", "하우스"),
+    (r"(?i)TOWER", "타워"),
+    (r"(?i)TOWN", "타운"),
+    (r"(?i)VIEW", "뷰"),
+    (r"(?i)PARK", "파크"),
+    (r"(?i)CITY", "시티"),
+    (r"(?i)HILL[S]?", "힐"),
+    (r"(?i)VILLE", "빌"),
+    (r"(?i)SQUARE", "스퀘어"),
+    (r"(?i)CENTRAL", "센트럴"),
+    (r"(?i)GRAND", "그랜드"),
+    (r"(?i)PREMIER", "프리미어"),
+    (r"(?i)SCIENCE", "사이언스"),
+    (r"(?i)OCEAN", "오션"),
+    (r"(?i)GREEN", "그린"),
+    (r"(?i)GOLD", "골드"),
+    (r"(?i)NOBLE", "노블"),
+    (r"(?i)STELLA", "스텔라"),
+    (r"(?i)FOREST",    "포레스트"),
+    (r"(?i)VALLEY",    "밸리"),
+    (r"(?i)TERRACE",   "테라스"),
+    (r"(?i)PLUS",      "플러스"),
+    (r"(?i)PRIME",     "프라임"),
+    (r"(?i)PRESTIGE",  "프레스티지"),
+    (r"(?i)\bTHE\b",   "더"),
+    (r"(?i)GRANDE?",   "그랑"),
+]
+_BRAND_WORD_PATTERNS = [(re.compile(p), r) for p, r in _BRAND_WORD_MAP]
+
+# 브랜드 약어 → 한글
+# (?<![a-zA-Z])..(?![a-zA-Z]) = ASCII 알파벳이 인접하지 않을 때만 매칭
+# "LG원앙" ✓ (뒤에 한글), "VILLAGE" ✗ (이미 3단계에서 치환됨)
+_BRAND_ABBR_MAP = [
+    (r"(?<![a-zA-Z])KCC(?![a-zA-Z])", "케이씨씨"),
+    (r"(?<![a-zA-Z])KBS(?![a-zA-Z])", "케이비에스"),
+    (r"(?<![a-zA-Z])LG(?![a-zA-Z])", "엘지"),
+    (r"(?<![a-zA-Z])LH(?![a-zA-Z])", "엘에이치"),
+    (r"(?<![a-zA-Z])SK(?![a-zA-Z])", "에스케이"),
+    (r"(?<![a-zA-Z])GS(?![a-zA-Z])", "지에스"),
+    (r"(?<![a-zA-Z])CJ(?![a-zA-Z])", "씨제이"),
+    (r"(?<![a-zA-Z])BJ(?![a-zA-Z])", "비제이"),
+    (r"(?<![a-zA-Z])TS(?![a-zA-Z])", "티에스"),
+    (r"(?<![a-zA-Z])YH(?![a-zA-Z])", "와이에이치"),
+    (r"(?<![a-zA-Z])BL(?![a-zA-Z])", "블록"),
+    (r"(?<![a-zA-Z])HDC(?![a-zA-Z])", "에이치디씨"),
+    (r"(?<![a-zA-Z])DL(?![a-zA-Z])",  "디엘"),
+]
+_BRAND_ABBR_PATTERNS = [(re.compile(p, re.IGNORECASE), r) for p, r in _BRAND_ABBR_MAP]
+
+# 정규화 결과 캐시 크기 (같은 단지명이 여러 매칭 호출에서 반복됨)
+# 전체 대상 지역 수집 1회분의 KB 단지명이 모두 들어가는 크기
+NAME_CACHE_SIZE = 16384
+
+
+def _compact_complexes(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """단지 목록 응답에서 COMPLEX_LIST_FIELDS만 남긴다.
+
+    목록은 캐시에 오래 머무르므로 매칭에 쓰지 않는 나머지 응답 필드는 버린다.
+    """
+    return [
+        {field: cx[field] for field in COMPLEX_LIST_FIELDS if field in cx}
+        for cx in data
+    ]
+
+
+def _retry_after_seconds(response: httpx.Response) -> float:
+    """Retry-After 헤더(초 단위)를 읽는다. 없거나 날짜 형식이면 0."""
+    try:
+        return max(float(response.headers.get("Retry-After", 0)), 0.0)
+    except ValueError:
+        return 0.0
+
+
+def _cache_get(cache: Dict, key: Any) -> Optional[List[Dict[str, Any]]]:
+    """TTL 캐시 조회 (만료된 항목은 삭제 후 None)."""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    stored_at, value = entry
+    if time.monotonic() - stored_at >= KB_LIST_CACHE_TTL:
+        del cache[key]
+        return None
+    return value
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def _normalize_name(name: str) -> str:
     """단지명 정규화 (구분 정보 보존 + 브랜드 약어 통일 버전).
 
@@ -3077,8 +3474,8 @@ def _normalize_name(name: str) -> str:
     브랜드 약어를 통일하여 "엘지"↔"LG", "에스케이"↔"SK" 등의 불일치를 해소한다.
     """
     # 괄호 안 단지/차 번호 추출: "(1단지)" → suffix로 보존
-    danji = re.search(r"\((\d+단지)\)", name)
-    cha = re.search(r"\((\d+차)\)", name)
+    danji = _RE_PAREN_DANJI.search(name)
+    cha = _RE_PAREN_CHA.search(name)
     suffix = ""
     if danji:
         suffix = danji.group(1)
@@ -3086,19 +3483,20 @@ def _normalize_name(name: str) -> str:
         suffix = cha.group(1)
 
     # 괄호 및 괄호 내용 제거
-    cleaned = re.sub(r"\([^)]*\)", "", name)
+    cleaned = _RE_PAREN.sub("", name)
     # 불필요 접미사 제거
-    cleaned = re.sub(r"아파트$", "", cleaned)
+    cleaned = _RE_APT_SUFFIX.sub("", cleaned)
     # 괄호에서 추출한 단지/차 번호 붙이기
     if suffix and suffix not in cleaned:
         cleaned = cleaned + suffix
     # 공백, 특수문자 제거 전에 브랜드 약어 통일 (대소문자 무관)
     cleaned = _unify_brand(cleaned)
     # 공백, 특수문자 제거 (숫자는 보존)
-    cleaned = re.sub(r"[^\w가-힣0-9]", "", cleaned.lower())
+    cleaned = _RE_NON_WORD_KEEP_DIGIT.sub("", cleaned.lower())
     return cleaned.strip()
 
 
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def _unify_brand(name: str) -> str:
     """브랜드 약어/영문을 한글 표기로 통일한다.
 
@@ -3121,84 +3519,59 @@ def _unify_brand(name: str) -> str:
     result = result.replace("&", "앤")
 
     # 2단계: e편한세상 계열 통일 (영문 단어 치환 전)
-    result = re.sub(r"(?i)e-편한세상", "이편한세상", result)
-    result = re.sub(r"(?i)e편한세상", "이편한세상", result)
+    result = _RE_E_PYEONHAN.sub("이편한세상", result)
 
     # 3단계: 영문 단어 → 한글 (긴/복합 패턴부터 처리)
-    word_map = [
-        # 복합 브랜드명 (먼저 처리해야 개별 단어 치환과 충돌 방지)
-        (r"(?i)I[\-\s]?PARK", "아이파크"),   # I-PARK, IPARK, I PARK
-        (r"(?i)I[\-\s]?Class", "아이클래스"), # I-Class, IClass
-        (r"(?i)TOP[\-\s]?Class", "탑클래스"), # TOP-Class, TOPClass
-        # 일반 영문 단어 (긴 것부터)
-        (r"(?i)VILLAGE", "빌리지"),
-        (r"(?i)PALACE", "팰리스"),
-        (r"(?i)CLASSIC", "클래식"),
-        (r"(?i)CLASS", "클래스"),
-        (r"(?i)HOUSE", "하우스"),
-        (r"(?i)TOWER", "타워"),
-        (r"(?i)TOWN", "타운"),
-        (r"(?i)VIEW", "뷰"),
-        (r"(?i)PARK", "파크"),
-        (r"(?i)CITY", "시티"),
-        (r"(?i)HILL[S]?", "힐"),
-        (r"(?i)VILLE", "빌"),
-        (r"(?i)SQUARE", "스퀘어"),
-        (r"(?i)CENTRAL", "센트럴"),
-        (r"(?i)GRAND", "그랜드"),
-        (r"(?i)PREMIER", "프리미어"),
-        (r"(?i)SCIENCE", "사이언스"),
-        (r"(?i)OCEAN", "오션"),
-        (r"(?i)GREEN", "그린"),
-        (r"(?i)GOLD", "골드"),
-        (r"(?i)NOBLE", "노블"),
-        (r"(?i)STELLA", "스텔라"),
-        (r"(?i)FOREST",    "포레스트"),
-        (r"(?i)VALLEY",    "밸리"),
-        (r"(?i)TERRACE",   "테라스"),
-        (r"(?i)PLUS",      "플러스"),
-        (r"(?i)PRIME",     "프라임"),
-        (r"(?i)PRESTIGE",  "프레스티지"),
-        (r"(?i)\bTHE\b",   "더"),
-        (r"(?i)GRANDE?",   "그랑"),
-    ]
-    for pattern, replacement in word_map:
-        result = re.sub(pattern, replacement, result)
-
-    # 4단계: 브랜드 약어 → 한글
-    # (?<![a-zA-Z])..(?![a-zA-Z]) = ASCII 알파벳이 인접하지 않을 때만 매칭
-    # "LG원앙" ✓ (뒤에 한글), "VILLAGE" ✗ (이미 3단계에서 치환됨)
-    abbr_map = [
-        (r"(?<![a-zA-Z])KCC(?![a-zA-Z])", "케이씨씨"),
-        (r"(?<![a-zA-Z])KBS(?![a-zA-Z])", "케이비에스"),
-        (r"(?<![a-zA-Z])LG(?![a-zA-Z])", "엘지"),
-        (r"(?<![a-zA-Z])LH(?![a-zA-Z])", "엘에이치"),
-        (r"(?<![a-zA-Z])SK(?![a-zA-Z])", "에스케이"),
-        (r"(?<![a-zA-Z])GS(?![a-zA-Z])", "지에스"),
-        (r"(?<![a-zA-Z])CJ(?![a-zA-Z])", "씨제이"),
-        (r"(?<![a-zA-Z])BJ(?![a-zA-Z])", "비제이"),
-        (r"(?<![a-zA-Z])TS(?![a-zA-Z])", "티에스"),
-        (r"(?<![a-zA-Z])YH(?![a-zA-Z])", "와이에이치"),
-        (r"(?<![a-zA-Z])BL(?![a-zA-Z])", "블록"),
-        (r"(?<![a-zA-Z])HDC(?![a-zA-Z])", "에이치디씨"),
-        (r"(?<![a-zA-Z])DL(?![a-zA-Z])",  "디엘"),
-    ]
-    for pattern, replacement in abbr_map:
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+    for pattern, replacement in _BRAND_WORD_PATTERNS:
+        result = pattern.sub(replacement, result)
+
+    # 4단계: 브랜드 약어 → 한글 (ASCII 알파벳이 인접하지 않을 때만)
+    for pattern, replacement in _BRAND_ABBR_PATTERNS:
+        result = pattern.sub(replacement, result)
 
     return result
 
 
+class _MatchKeys(NamedTuple):
+    """스코어링 단계별 비교 키 (정규화된 단지명 1개당 한 번만 계산)."""
+
+    brand: str                # 브랜드 통일
+    loose: str                # loose 정규화 (N단지/N차 등 제거)
+    brand_loose: str          # 브랜드 통일 + N단지/N차/N블록 제거
+    tokens: FrozenSet[str]    # Jaccard용 토큰 (한글 2+글자, 숫자단지/차)
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _match_keys(name: str) -> _MatchKeys:
+    """정규화된 단지명의 비교 키를 만든다.
+
+    KB 후보 단지명은 같은 목록으로 여러 단지를 매칭할 때마다 반복되므로,
+    정규식 처리를 후보마다 다시 하지 않고 이름별로 한 번만 계산해 재사용한다.
+    """
+    # _normalize_name에서 이미 _unify_brand를 호출하지만,
+    # 기존 캐시 데이터와의 호환성을 위해 여기서도 한번 더 처리
+    brand = _RE_NON_WORD_KEEP_DIGIT.sub("", _unify_brand(name).lower()).strip()
+    brand_loose = _RE_DANJI_NUM.sub("", _RE_CHA_NUM.sub("",
+        _RE_BLOCK_NUM.sub("", brand))).strip()
+    return _MatchKeys(
+        brand=brand,
+        loose=_normalize_name_loose(name),
+        brand_loose=brand_loose,
+        tokens=frozenset(_RE_NAME_TOKENS.findall(brand)),
+    )
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def _normalize_name_loose(name: str) -> str:
     """느슨한 정규화: N단지/N차도 제거 (fuzzy 매칭 fallback용)."""
-    cleaned = re.sub(r"\([^)]*\)", "", name)
-    cleaned = re.sub(r"\d+단지", "", cleaned)
-    cleaned = re.sub(r"\d+차", "", cleaned)
-    cleaned = re.sub(r"\d+블록", "", cleaned)
-    cleaned = re.sub(r"\d+BL", "", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"아파트", "", cleaned)
+    cleaned = _RE_PAREN.sub("", name)
+    cleaned = _RE_DANJI_NUM.sub("", cleaned)
+    cleaned = _RE_CHA_NUM.sub("", cleaned)
+    cleaned = _RE_BLOCK_NUM.sub("", cleaned)
+    cleaned = _RE_BL_NUM.sub("", cleaned)
+    cleaned = _RE_APT.sub("", cleaned)
     cleaned = _unify_brand(cleaned)
-    cleaned = re.sub(r"[^\w가-힣]", "", cleaned.lower())
+    cleaned = _RE_NON_WORD.sub("", cleaned.lower())
     return cleaned.strip()
 
 
@@ -3214,7 +3587,7 @@ def _calc_match_score(target: str, candidate: str) -> int:
        80: 부분 포함 + 길이 비율 >= 0.5
        70: 부분 포함 + 길이 비율 < 0.5
     60-85: 토큰 Jaccard 유사도
-    40-70: SequenceMatcher ratio >= 0.55
+    40-70: RapidFuzz ratio >= 0.55
         0: 매칭 안됨
 
     Args:
@@ -3231,34 +3604,30 @@ def _calc_match_score(target: str, candidate: str) -> int:
     if target == candidate:
         return 100
 
+    # 단계별 비교 키는 이름별로 캐시됨 (후보 쪽 정규식 재실행 없음)
+    t = _match_keys(target)
+    c = _match_keys(candidate)
+    target_brand = t.brand
+    cand_brand = c.brand
+
     # Level 1.5: 브랜드 통일 후 완전 일치
-    # _normalize_name에서 이미 _unify_brand를 호출하지만,
-    # 기존 캐시 데이터와의 호환성을 위해 여기서도 한번 더 처리
-    target_brand = re.sub(r"[^\w가-힣0-9]", "", _unify_brand(target).lower()).strip()
-    cand_brand = re.sub(r"[^\w가-힣0-9]", "", _unify_brand(candidate).lower()).strip()
     if target_brand and cand_brand and target_brand == cand_brand:
         return 97
 
     # Level 2: loose 정규화 후 완전 일치 (N단지/N차/N블록/NBL 차이만 있는 경우)
-    target_loose = _normalize_name_loose(target)
-    cand_loose = _normalize_name_loose(candidate)
-    if target_loose and cand_loose and target_loose == cand_loose:
+    if t.loose and c.loose and t.loose == c.loose:
         return 95
 
     # Level 2.5: 브랜드 통일 + loose (N단지/N차/N블록 제거)
-    target_brand_loose = re.sub(r"\d+단지", "", re.sub(r"\d+차", "",
-        re.sub(r"\d+블록", "", target_brand))).strip()
-    cand_brand_loose = re.sub(r"\d+단지", "", re.sub(r"\d+차", "",
-        re.sub(r"\d+블록", "", cand_brand))).strip()
-    if target_brand_loose and cand_brand_loose and target_brand_loose == cand_brand_loose:
+    if t.brand_loose and c.brand_loose and t.brand_loose == c.brand_loose:
         return 92
 
     # Level 3: 부분 포함 (길이 비율에 따라 차등)
     # 브랜드 통일된 버전으로도 부분 포함 체크
-    for t, c in [(target, candidate), (target_brand, cand_brand)]:
-        if t in c or c in t:
-            shorter = min(len(t), len(c))
-            longer = max(len(t), len(c))
+    for tn, cn in [(target, candidate), (target_brand, cand_brand)]:
+        if tn in cn or cn in tn:
+            shorter = min(len(tn), len(cn))
+            longer = max(len(tn), len(cn))
             ratio = shorter / longer if longer > 0 else 0
             if ratio >= 0.7:
                 return 90
@@ -3268,21 +3637,21 @@ def _calc_match_score(target: str, candidate: str) -> int:
                 return 70
 
     # Level 4: 토큰 Jaccard 유사도 (한글 2+글자 + 숫자단지/차)
-    # 브랜드 통일된 버전으로 토큰 추출
-    tokens_t = set(re.findall(r"[가-힣]{2,}|\d+(?:단지|차)?", target_brand))
-    tokens_c = set(re.findall(r"[가-힣]{2,}|\d+(?:단지|차)?", cand_brand))
-    if tokens_t and tokens_c:
+    # 브랜드 통일된 버전으로 토큰 추출 (공통 토큰이 없으면 교집합 계산 생략)
+    tokens_t = t.tokens
+    tokens_c = c.tokens
+    if tokens_t and tokens_c and not tokens_t.isdisjoint(tokens_c):
         intersection = tokens_t & tokens_c
         union = tokens_t | tokens_c
-        jaccard = len(intersection) / len(union) if union else 0
+        jaccard = len(intersection) / len(union)
         if jaccard > 0.3:
             # 0.3~1.0 → 60~85
             token_score = int(60 + (jaccard - 0.3) / 0.7 * 25)
             return min(token_score, 85)
 
-    # Level 5: Fuzzy match (SequenceMatcher) — threshold 0.6→0.55로 완화
-    # 브랜드 통일된 버전으로 비교
-    seq_ratio = difflib.SequenceMatcher(None, target_brand, cand_brand).ratio()
+    # Level 5: Fuzzy match (RapidFuzz Indel 유사도, C++ 구현) — threshold 0.6→0.55로 완화
+    # 브랜드 통일된 버전으로 비교 (cutoff 미만이면 0 반환)
+    seq_ratio = fuzz.ratio(target_brand, cand_brand, score_cutoff=55) / 100
     if seq_ratio >= 0.55:
         # 0.55~1.0 → 40~70
         fuzzy_score = int(40 + (seq_ratio - 0.55) / 0.45 * 30)
@@ -3291,6 +3660,12 @@ def _calc_match_score(target: str, candidate: str) -> int:
     return 0
 
 
+def _dong_keyword(dong: str) -> str:
+    """주소 필터에 쓸 동 이름 (읍/면 + 리 형식은 "기장읍 대라리" → "기장읍")."""
+    dong_parts = dong.split()
+    return dong_parts[0] if dong_parts else dong
+
+
 def _filter_by_dong(
     kb_complexes: List[Dict[str, Any]],
     dong: str,
@@ -3310,9 +3685,7 @@ def _filter_by_dong(
     if not dong:
         return kb_complexes
 
-    # 읍/면 + 리 형식 처리: "기장읍 대라리" → "기장읍"으로도 매칭
-    dong_parts = dong.split()
-    dong_main = dong_parts[0] if dong_parts else dong
+    dong_main = _dong_keyword(dong)
 
     filtered = [
         cx for cx in kb_complexes
@@ -0,0 +1,45 @@
+"""
+비동기 토큰 버킷 rate limiter
+
+외부 API 호출 속도를 초당 N건으로 제한합니다.
+요청마다 고정 딜레이를 두는 방식과 달리, 한도 안에서는 여러 요청이
+동시에 진행되고 한도를 넘는 요청만 순서대로 대기합니다.
+"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """초당 rate개 토큰이 채워지는 버킷 (최대 capacity개).
+
+    acquire()는 토큰 1개를 예약하고, 토큰이 모자라면 채워질 때까지 대기한다.
+    이벤트 루프 안에서 await 없이 예약을 끝내므로 락이 필요 없다.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        """
+        Args:
+            rate: 초당 허용 요청 수
+            capacity: 한 번에 몰아서 보낼 수 있는 최대 요청 수 (burst)
+        """
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다")
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    async def acquire(self):
+        """토큰 1개를 사용한다 (부족하면 채워질 때까지 대기)."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity,
+            self._tokens + (now - self._updated) * self._rate,
+        )
+        self._updated = now
+
+        # 토큰을 먼저 예약 (음수면 앞선 대기 요청 뒤에 줄 선 것)
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self._rate)
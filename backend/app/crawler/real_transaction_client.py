@@ -16,6 +16,7 @@ from typing import Any, Dict, List, Optional
 
 import httpx
 
+from app.crawler.rate_limiter import TokenBucket
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -34,12 +35,58 @@ API_BASE_URL = (
 MAX_RETRIES = 3
 RETRY_BACKOFF_BASE = 2.0  # 지수 백오프 기본 초
 
+# 시도 회차별 대기 시간 (초) — 재시도마다 거듭제곱을 다시 계산하지 않도록 미리 계산
+_BACKOFF = tuple(RETRY_BACKOFF_BASE ** a for a in range(1, MAX_RETRIES + 1))
+_BACKOFF_429 = tuple(w * 2 for w in _BACKOFF)  # Rate limit 초과 시 더 긴 대기
+
 # Rate limiting: 요청 간 최소 간격 (초)
 REQUEST_DELAY = 1.0
 
+# 프로세스 공통 호출 한도 (클라이언트 인스턴스·동시 페이지 조회와 무관하게 REQUEST_DELAY 간격 유지)
+_RATE_BUCKET = TokenBucket(rate=1 / REQUEST_DELAY)
+
 # 한 페이지당 최대 조회 건수
 DEFAULT_NUM_OF_ROWS = 1000
 
+# 2페이지 이후를 동시에 조회할 최대 요청 수
+PAGE_CONCURRENCY = 3
+
+# HTTP 연결 풀 / 타임아웃
+RT_HTTP_LIMITS = httpx.Limits(
+    max_connections=16,
+    max_keepalive_connections=16,
+    keepalive_expiry=60.0,
+)
+RT_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+# 서버 수명 동안 모든 RealTransactionClient가 나눠 쓰는 HTTP 클라이언트
+# (지역/월마다 클라이언트를 새로 만들어도 TCP/TLS 연결을 재사용)
+_SHARED_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _new_http_client() -> httpx.AsyncClient:
+    """실거래가 API용 AsyncClient 생성 (keep-alive)."""
+    return httpx.AsyncClient(
+        timeout=RT_HTTP_TIMEOUT,
+        limits=RT_HTTP_LIMITS,
+        follow_redirects=True,
+    )
+
+
+async def init_real_transaction_client():
+    """공유 실거래가 API 클라이언트를 생성한다 (서버 시작 시 호출)."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+        _SHARED_CLIENT = _new_http_client()
+
+
+async def close_real_transaction_client():
+    """공유 실거래가 API 클라이언트를 정리한다 (서버 종료 시 호출)."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is not None:
+        await _SHARED_CLIENT.aclose()
+        _SHARED_CLIENT = None
+
 # ──────────────────────────────────────────
 # 서울 주요 구 법정동코드 (앞 5자리) 매핑
 # 실제 운영에서는 DB 또는 외부 코드 테이블을 사용해야 합니다.
@@ -381,16 +428,15 @@ class RealTransactionClient:
             )
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """lazy-init으로 AsyncClient 생성."""
+        """공유 클라이언트가 있으면 사용, 없으면 (스크립트 실행 등) lazy-init으로 생성."""
+        if _SHARED_CLIENT is not None and not _SHARED_CLIENT.is_closed:
+            return _SHARED_CLIENT
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(30.0, connect=10.0),
-                follow_redirects=True,
-            )
+            self._client = _new_http_client()
         return self._client
 
     async def close(self):
-        """클라이언트 종료."""
+        """클라이언트 종료 (공유 클라이언트는 close_real_transaction_client()에서 정리)."""
         if self._client and not self._client.is_closed:
             await self._client.aclose()
             self._client = None
@@ -408,6 +454,7 @@ class RealTransactionClient:
             XML 응답 문자열, 실패 시 None
         """
         client = await self._get_client()
+        get = client.get
 
         for attempt in range(1, MAX_RETRIES + 1):
             try:
@@ -415,14 +462,14 @@ class RealTransactionClient:
                     "실거래가 API 요청 [%d/%d]: params=%s",
                     attempt, MAX_RETRIES, params,
                 )
-                response = await client.get(API_BASE_URL, params=params)
+                response = await get(API_BASE_URL, params=params)
 
                 if response.status_code == 200:
                     return response.text
 
                 if response.status_code == 429:
                     # Rate limit 초과 - 더 긴 대기
-                    wait = RETRY_BACKOFF_BASE ** attempt * 2
+                    wait = _BACKOFF_429[attempt - 1]
                     logger.warning(
                         "Rate limited (429). %.1f초 후 재시도 (%d/%d)",
                         wait, attempt, MAX_RETRIES,
@@ -449,12 +496,12 @@ class RealTransactionClient:
                 )
             except httpx.HTTPError as e:
                 logger.warning(
-                    "HTTP 에러: %s (%d/%d)", str(e), attempt, MAX_RETRIES,
+                    "HTTP 에러: %s (%d/%d)", e, attempt, MAX_RETRIES,
                 )
 
             # 지수 백오프 대기
             if attempt < MAX_RETRIES:
-                wait = RETRY_BACKOFF_BASE ** attempt
+                wait = _BACKOFF[attempt - 1]
                 logger.info("%.1f초 후 재시도...", wait)
                 await asyncio.sleep(wait)
 
@@ -462,8 +509,8 @@ class RealTransactionClient:
         return None
 
     async def _throttle(self):
-        """요청 간 딜레이 적용 (rate limiting)."""
-        await asyncio.sleep(REQUEST_DELAY)
+        """요청 간 딜레이 적용 (rate limiting, 동시 요청도 토큰 버킷으로 순서대로 대기)."""
+        await _RATE_BUCKET.acquire()
 
     # ──────────────────────────────────────────
     # 공개 메서드
@@ -520,6 +567,23 @@ class RealTransactionClient:
         )
         return results
 
+    async def _fetch_page(
+        self,
+        lawd_cd: str,
+        deal_ymd: str,
+        page_no: int,
+    ) -> Optional[str]:
+        """한 페이지 XML 조회 (요청 간 딜레이 포함, 실패 시 None)."""
+        params = {
+            "serviceKey": self._service_key,
+            "LAWD_CD": lawd_cd,
+            "DEAL_YMD": deal_ymd,
+            "pageNo": str(page_no),
+            "numOfRows": str(DEFAULT_NUM_OF_ROWS),
+        }
+        await self._throttle()
+        return await self._request_raw(params)
+
     async def fetch_all_transactions(
         self,
         lawd_cd: str,
@@ -527,7 +591,8 @@ class RealTransactionClient:
     ) -> List[Dict[str, Any]]:
         """특정 지역/기간의 모든 아파트매매 실거래가를 페이지네이션으로 조회한다.
 
-        totalCount가 numOfRows보다 크면 다음 페이지를 자동으로 조회한다.
+        1페이지의 totalCount가 numOfRows보다 크면 나머지 페이지를 동시에 조회한다
+        (최대 PAGE_CONCURRENCY건씩). 실패한 페이지가 있으면 그 앞 페이지까지만 반환한다.
 
         Args:
             lawd_cd: 법정동코드 앞 5자리
@@ -537,28 +602,36 @@ class RealTransactionClient:
             전체 정규화된 거래 데이터 리스트
         """
         all_results: List[Dict[str, Any]] = []
-        page_no = 1
-
-        while True:
-            params = {
-                "serviceKey": self._service_key,
-                "LAWD_CD": lawd_cd,
-                "DEAL_YMD": deal_ymd,
-                "pageNo": str(page_no),
-                "numOfRows": str(DEFAULT_NUM_OF_ROWS),
-            }
-
-            await self._throttle()
-            xml_text = await self._request_raw(params)
+
+        # 1페이지로 전체 건수 확인
+        xml_text = await self._fetch_page(lawd_cd, deal_ymd, 1)
+        pages = [xml_text] if xml_text is not None else []
+        if xml_text is not None:
+            total_count = _parse_total_count(xml_text)
+            # 나머지 페이지는 동시에 조회 (결과는 페이지 순서대로 처리)
+            last_page = -(-total_count // DEFAULT_NUM_OF_ROWS)
+            if last_page > 1:
+                semaphore = asyncio.Semaphore(PAGE_CONCURRENCY)
+
+                async def _page(page_no: int) -> Optional[str]:
+                    async with semaphore:
+                        return await self._fetch_page(lawd_cd, deal_ymd, page_no)
+
+                pages += await asyncio.gather(*(
+                    _page(page_no) for page_no in range(2, last_page + 1)
+                ))
+
+        for page_no, xml_text in enumerate(pages, 1):
             if xml_text is None:
                 break
 
             try:
                 raw_items = _parse_xml_items(xml_text)
-                total_count = _parse_total_count(xml_text)
             except ValueError as e:
                 logger.error("XML 파싱 실패 (page %d): %s", page_no, e)
                 break
+            if not raw_items:
+                break
 
             # 정규화 후 결과에 추가
             for raw in raw_items:
@@ -566,13 +639,6 @@ class RealTransactionClient:
                 if normalized is not None:
                     all_results.append(normalized)
 
-            # 다음 페이지 확인
-            fetched_so_far = page_no * DEFAULT_NUM_OF_ROWS
-            if fetched_so_far >= total_count or len(raw_items) == 0:
-                break
-
-            page_no += 1
-
         logger.info(
             "전체 실거래가 조회 완료: LAWD_CD=%s, DEAL_YMD=%s, 총 %d건",
             lawd_cd, deal_ymd, len(all_results),
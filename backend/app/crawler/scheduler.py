@@ -51,7 +51,7 @@ async def run_kb_price_job() -> Dict[str, Any]:
         return stats
 
     except Exception as e:
-        logger.error("KB시세 수집 실패: %s", str(e), exc_info=True)
+        logger.error("KB시세 수집 실패: %s", e, exc_info=True)
         return {}
     finally:
         await service.close()
@@ -95,7 +95,7 @@ async def run_real_transaction_job() -> List[Dict[str, Any]]:
                 except Exception as e:
                     logger.error(
                         "실거래가 수집 실패 (%s %s %s): %s",
-                        sido, sigungu, deal_ymd, str(e),
+                        sido, sigungu, deal_ymd, e,
                     )
 
         total_saved = sum(r.get("saved", 0) for r in results)
@@ -108,7 +108,7 @@ async def run_real_transaction_job() -> List[Dict[str, Any]]:
         return results
 
     except Exception as e:
-        logger.error("실거래가 수집 실패: %s", str(e), exc_info=True)
+        logger.error("실거래가 수집 실패: %s", e, exc_info=True)
         return []
     finally:
         db.close()
@@ -132,7 +132,7 @@ def run_complex_comparison_job() -> Dict[str, Any]:
         )
         return result
     except Exception as e:
-        logger.error("단지 비교 실패: %s", str(e), exc_info=True)
+        logger.error("단지 비교 실패: %s", e, exc_info=True)
         return {}
     finally:
         db.close()
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, BigInteger, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Float, DateTime, BigInteger, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.models.database import Base
@@ -23,6 +24,13 @@ class ApartmentComplex(Base):
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        # 지역별 집계/필터 (대시보드 지역 통계, 단지 목록 지역 필터)
+        # + 실거래 수집 시 거래마다 실행되는 (시/도, 시/군/구, 단지명) 정확 일치 조회
+        # (앞 두 컬럼만으로도 지역 필터에 쓰이므로 기존 ix_apartment_complex_region 대체)
+        Index("ix_apartment_complex_region_name", "sido", "sigungu", "name"),
+    )
+
 
 class KBPrice(Base):
     """KB 시세"""
@@ -53,6 +61,11 @@ class RealTransaction(Base):
     deal_date = Column(DateTime, nullable=False)
     created_at = Column(DateTime, server_default=func.now())
 
+    __table_args__ = (
+        # 단지/면적별 최근 거래 조회 (비교 갱신, 실거래 목록/요약)
+        Index("ix_real_transaction_complex_area_date", complex_id, area_sqm, deal_date.desc()),
+    )
+
 
 class ComplexComparison(Base):
     """단지별 KB시세 vs 최근 실거래가 비교"""
@@ -68,6 +81,15 @@ class ComplexComparison(Base):
     deal_count_3m = Column(Integer, default=0)  # 최근 3개월 거래 건수
     compared_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
+    # 목록 API에서 contains_eager로 함께 로드 (지연 로딩 시 N+1 대신 즉시 에러)
+    complex = relationship("ApartmentComplex", lazy="raise")
+
     __table_args__ = (
         UniqueConstraint("complex_id", "area_sqm", name="uq_complex_comparison"),
+        # 할인율 정렬 + 비교 시각 필터 (단지 목록 기본 정렬, 급매 알림)
+        Index(
+            "ix_complex_comparison_discount",
+            deal_discount_rate.desc(),
+            compared_at.desc(),
+        ),
     )
@@ -1,4 +1,9 @@
+import json
+from typing import Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from config.settings import settings
@@ -7,6 +12,24 @@ engine = create_engine(settings.DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# 동기 드라이버 → 비동기 드라이버 매핑 (API 조회 경로용)
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def _to_async_url(url: str) -> str:
+    """DATABASE_URL의 드라이버를 비동기 드라이버로 바꾼다."""
+    parsed = make_url(url)
+    drivername = _ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+async_engine = create_async_engine(_to_async_url(settings.DATABASE_URL))
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
 
 def get_db():
     db = SessionLocal()
@@ -14,3 +37,43 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """조회 API용 비동기 세션 (DB 대기 중 이벤트 루프를 막지 않음)."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def estimate_count(db: AsyncSession, stmt) -> Optional[int]:
+    """PostgreSQL 플래너의 예상 행 수를 반환한다 (EXPLAIN만 실행, 실제 조회 없음).
+
+    페이지네이션 표시용 근사치이며 정확한 COUNT가 필요한 곳에는 쓰지 않는다.
+    PostgreSQL이 아니면 None을 반환한다.
+
+    Args:
+        db: 비동기 세션
+        stmt: 건수를 추정할 SELECT 문 (바인드 값은 리터럴로 인라인됨)
+    """
+    dialect = async_engine.dialect
+    if dialect.name != "postgresql":
+        return None
+
+    compiled = stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    conn = await db.connection()
+    plan = (await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def create_missing_indexes(bind=None):
+    """모델에 선언된 인덱스 중 DB에 없는 것을 생성한다.
+
+    create_all()은 이미 존재하는 테이블의 인덱스를 추가하지 않으므로,
+    기존 테이블에 새로 선언한 인덱스는 여기서 생성한다.
+    """
+    bind = bind or engine
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
@@ -0,0 +1,70 @@
+"""
+지역 목록 Materialized View (PostgreSQL 전용)
+
+apartment_complex의 (sido, sigungu) 조합을 미리 모아둔 mv_regions 뷰입니다.
+지역 선택 API가 요청마다 apartment_complex 전체에 DISTINCT를 돌리지 않도록 합니다.
+
+- 서버 시작 시 create_region_view()로 생성
+- 신규 단지 저장 / 비교 갱신 후 refresh_region_view()로 갱신
+- PostgreSQL이 아니면 apartment_complex를 직접 조회
+"""
+
+import logging
+
+from sqlalchemy import Column, MetaData, String, Table, text
+from sqlalchemy.orm import Session
+
+from app.models.apartment import ApartmentComplex
+from app.models.database import async_engine, engine
+
+logger = logging.getLogger(__name__)
+
+# 뷰는 create_all() 대상이 아니므로 Base.metadata와 분리
+region_metadata = MetaData()
+
+mv_regions = Table(
+    "mv_regions",
+    region_metadata,
+    Column("sido", String(20)),
+    Column("sigungu", String(20)),
+)
+
+_CREATE_VIEW_SQL = (
+    "CREATE MATERIALIZED VIEW IF NOT EXISTS mv_regions AS "
+    "SELECT DISTINCT sido, sigungu FROM apartment_complex"
+)
+# CONCURRENTLY 갱신에 필요한 유니크 인덱스
+_CREATE_INDEX_SQL = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_regions ON mv_regions (sido, sigungu)"
+)
+_REFRESH_VIEW_SQL = "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_regions"
+
+
+def region_source():
+    """지역 목록 조회 대상 테이블 (PostgreSQL이면 mv_regions, 아니면 apartment_complex)."""
+    if async_engine.dialect.name == "postgresql":
+        return mv_regions
+    return ApartmentComplex.__table__
+
+
+def create_region_view(bind=None):
+    """mv_regions 뷰와 유니크 인덱스를 생성한다 (이미 있으면 무시)."""
+    bind = bind or engine
+    if bind.dialect.name != "postgresql":
+        return
+    with bind.begin() as conn:
+        conn.execute(text(_CREATE_VIEW_SQL))
+        conn.execute(text(_CREATE_INDEX_SQL))
+
+
+def refresh_region_view(db: Session):
+    """mv_regions 뷰를 갱신한다 (조회를 막지 않는 CONCURRENTLY 갱신).
+
+    Args:
+        db: SQLAlchemy 세션 (갱신 후 커밋함)
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    db.execute(text(_REFRESH_VIEW_SQL))
+    db.commit()
+    logger.info("지역 목록 뷰(mv_regions) 갱신 완료")
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ComplexListItem(BaseModel):
@@ -23,8 +23,7 @@ class ComplexListItem(BaseModel):
     deal_count_3m: int = Field(0, description="최근 3개월 거래 건수")
     compared_at: Optional[datetime] = Field(None, description="비교 갱신 시각")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ComplexListResponse(BaseModel):
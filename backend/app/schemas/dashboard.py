@@ -47,3 +47,10 @@ class RegionBreakdownResponse(BaseModel):
     """지역별 통계 응답"""
     total_regions: int = Field(..., description="전체 지역 수")
     items: List[RegionStatItem] = Field(default_factory=list)
+
+
+class DashboardBootstrapResponse(BaseModel):
+    """대시보드 초기 로드 응답 (요약 + 스케줄러 + 지역별 통계)"""
+    summary: DBSummaryResponse
+    scheduler: SchedulerStatusResponse
+    regions: RegionBreakdownResponse
@@ -0,0 +1,238 @@
+"""
+Redis 캐시 서비스 (cache-aside)
+
+크롤러 실행 시에만 바뀌는 조회 API 응답(지역 목록, 대시보드 통계, 실거래 요약)과
+크롤링 실행 간 재사용하는 KB 단지 목록/면적 타입을 Redis에 TTL과 함께 저장합니다.
+
+- REDIS_URL 미설정 시 캐시 없이 바로 DB 조회
+- Redis 장애 시에도 DB 조회로 대체 (캐시는 최적화일 뿐 필수 아님)
+- 크롤러 쓰기 완료 시 invalidate()로 관련 키 삭제
+"""
+
+import asyncio
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+import orjson
+import redis
+import redis.asyncio as aioredis
+from pydantic import BaseModel
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# 기본 TTL (초)
+DEFAULT_TTL = 300
+
+# 재계산 락 (cold start 시 동시 요청이 모두 DB로 몰리는 것 방지)
+LOCK_TTL_MS = 5000
+LOCK_WAIT_INTERVAL = 0.05
+LOCK_WAIT_STEPS = 40
+
+# ──────────────────────────────────────────
+# 캐시 키 스킴 (구조가 바뀌면 버전 올리기)
+# ──────────────────────────────────────────
+SIDO_KEY = "fmh:sido:v1"
+DASH_SUMMARY_KEY = "fmh:dash:summary:v1"
+DASH_REGIONS_KEY = "fmh:dash:regions:v1"
+
+# 단지 목록 전체 건수 TTL (초) — 페이지 이동 시 COUNT 재실행 방지
+LIST_TOTAL_TTL = 60
+
+# 실거래 요약 TTL (초) — 수집 시 무효화되므로 길게
+TX_SUMMARY_TTL = 3600
+
+# KB 단지 목록/면적 타입 TTL (초) — 크롤링 실행 간 재사용 (KB 단지 정보는 며칠 단위로 바뀜)
+KB_META_TTL = 86400
+
+# 무효화 패턴
+DASHBOARD_PATTERN = "fmh:dash:*"
+REGION_PATTERNS = ("fmh:sido:*", "fmh:sigungu:*")
+COMPLEX_LIST_PATTERN = "fmh:complexes:*"
+TX_SUMMARY_PATTERN = "fmh:txsum:*"
+
+
+def sigungu_key(sido: str) -> str:
+    """시/도별 시/군/구 목록 캐시 키."""
+    return f"fmh:sigungu:v1:{sido}"
+
+
+def tx_summary_key(complex_id: int, area_sqm: Optional[float]) -> str:
+    """단지(+면적)별 실거래 요약 캐시 키."""
+    return f"fmh:txsum:v1:{complex_id}:{area_sqm if area_sqm is not None else 'all'}"
+
+
+def kb_complex_list_key(lawdcd: str) -> str:
+    """법정동코드별 KB 단지 목록 캐시 키."""
+    return f"fmh:kb:list:v1:{lawdcd}"
+
+
+def kb_types_key(complex_id: int) -> str:
+    """KB 단지별 면적 타입 캐시 키."""
+    return f"fmh:kb:types:v1:{complex_id}"
+
+
+def list_total_key(filters: dict) -> str:
+    """단지 목록 필터 조합별 전체 건수 캐시 키 (필터 값 해시)."""
+    digest = hashlib.sha1(orjson.dumps(filters, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    return f"fmh:complexes:total:v1:{digest[:16]}"
+
+
+_async_client: Optional[aioredis.Redis] = None
+_sync_client: Optional[redis.Redis] = None
+
+
+def _get_async_client() -> Optional[aioredis.Redis]:
+    """API용 비동기 Redis 클라이언트 (REDIS_URL 없으면 None)."""
+    global _async_client
+    if not settings.REDIS_URL:
+        return None
+    if _async_client is None:
+        _async_client = aioredis.Redis.from_url(settings.REDIS_URL)
+    return _async_client
+
+
+def _get_sync_client() -> Optional[redis.Redis]:
+    """크롤러(동기 코드)용 Redis 클라이언트 (REDIS_URL 없으면 None)."""
+    global _sync_client
+    if not settings.REDIS_URL:
+        return None
+    if _sync_client is None:
+        _sync_client = redis.Redis.from_url(settings.REDIS_URL)
+    return _sync_client
+
+
+def _to_json_bytes(value: Any) -> bytes:
+    if isinstance(value, BaseModel):
+        value = value.model_dump(mode="json")
+    return orjson.dumps(value)
+
+
+async def cached_json(
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    ttl: int = DEFAULT_TTL,
+) -> Any:
+    """캐시 hit이면 저장된 JSON을, miss이면 loader() 결과를 저장 후 반환한다.
+
+    Args:
+        key: 캐시 키
+        loader: DB 조회 코루틴 함수 (Pydantic 모델 또는 JSON 직렬화 가능 값 반환)
+        ttl: 만료 시간 (초)
+
+    Returns:
+        캐시 hit 시 역직렬화된 값, miss 시 loader() 반환값
+    """
+    client = _get_async_client()
+    if client is None:
+        return await loader()
+
+    try:
+        cached = await client.get(key)
+        if cached is not None:
+            return orjson.loads(cached)
+
+        # 재계산 락: 먼저 잡은 요청만 DB 조회, 나머지는 잠시 대기 후 재조회
+        locked = await client.set(f"{key}:lock", b"1", nx=True, px=LOCK_TTL_MS)
+        if not locked:
+            for _ in range(LOCK_WAIT_STEPS):
+                await asyncio.sleep(LOCK_WAIT_INTERVAL)
+                cached = await client.get(key)
+                if cached is not None:
+                    return orjson.loads(cached)
+    except redis.RedisError as e:
+        logger.warning("Redis 조회 실패, DB 직접 조회: %s", e)
+        return await loader()
+
+    try:
+        result = await loader()
+        try:
+            await client.set(key, _to_json_bytes(result), ex=ttl)
+        except redis.RedisError as e:
+            logger.warning("Redis 저장 실패: %s", e)
+    finally:
+        # loader 예외(404 등) 시에도 락을 풀어 대기 중인 요청이 묶이지 않게 함
+        if locked:
+            try:
+                await client.delete(f"{key}:lock")
+            except redis.RedisError:
+                pass
+    return result
+
+
+async def get_json(key: str) -> Any:
+    """JSON 캐시 값 조회 (없거나 Redis 미사용/장애 시 None)."""
+    client = _get_async_client()
+    if client is None:
+        return None
+    try:
+        value = await client.get(key)
+    except redis.RedisError as e:
+        logger.warning("Redis 조회 실패: %s", e)
+        return None
+    return orjson.loads(value) if value is not None else None
+
+
+async def set_json(key: str, value: Any, ttl: int = DEFAULT_TTL) -> None:
+    """JSON 캐시 값 저장 (Redis 미사용/장애 시 무시)."""
+    client = _get_async_client()
+    if client is None:
+        return
+    try:
+        await client.set(key, _to_json_bytes(value), ex=ttl)
+    except redis.RedisError as e:
+        logger.warning("Redis 저장 실패: %s", e)
+
+
+async def get_int(key: str) -> Optional[int]:
+    """정수 캐시 값 조회 (없거나 Redis 미사용/장애 시 None)."""
+    client = _get_async_client()
+    if client is None:
+        return None
+    try:
+        value = await client.get(key)
+    except redis.RedisError as e:
+        logger.warning("Redis 조회 실패: %s", e)
+        return None
+    return int(value) if value is not None else None
+
+
+async def set_int(key: str, value: int, ttl: int = DEFAULT_TTL) -> None:
+    """정수 캐시 값 저장 (Redis 미사용/장애 시 무시)."""
+    client = _get_async_client()
+    if client is None:
+        return
+    try:
+        await client.set(key, value, ex=ttl)
+    except redis.RedisError as e:
+        logger.warning("Redis 저장 실패: %s", e)
+
+
+def invalidate(*patterns: str) -> int:
+    """패턴에 맞는 캐시 키를 SCAN으로 찾아 삭제한다 (크롤러 쓰기 완료 시 호출).
+
+    Args:
+        patterns: 삭제할 키 패턴 (예: "fmh:dash:*")
+
+    Returns:
+        삭제한 키 개수
+    """
+    client = _get_sync_client()
+    if client is None:
+        return 0
+
+    deleted = 0
+    try:
+        for pattern in patterns:
+            keys = list(client.scan_iter(match=pattern, count=500))
+            if keys:
+                deleted += client.delete(*keys)
+    except redis.RedisError as e:
+        logger.warning("Redis 캐시 무효화 실패 (%s): %s", patterns, e)
+        return deleted
+
+    if deleted:
+        logger.info("캐시 무효화: %s → %d개 키 삭제", patterns, deleted)
+    return deleted
@@ -11,9 +11,9 @@ ComplexComparison 테이블을 갱신합니다.
 
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 
 from app.models.apartment import (
@@ -22,12 +22,17 @@ from app.models.apartment import (
     RealTransaction,
     ComplexComparison,
 )
+from app.models.region import refresh_region_view
+from app.services import cache_service
 
 logger = logging.getLogger(__name__)
 
 # 3개월 거래 건수 계산용 기간 (일)
 RECENT_COUNT_DAYS = 90
 
+# KB시세 순회 시 한 번에 가져올 행 수
+KB_ROWS_CHUNK_SIZE = 1000
+
 
 def _get_recent_deal(
     db: Session,
@@ -48,9 +53,18 @@ def _get_recent_deal(
     Returns:
         {'deal_price': int, 'deal_date': datetime, 'deal_count': int} 또는 None
     """
-    # 면적 허용 오차 내 가장 최근 거래 조회 (기간 제한 없음)
+    # 면적 허용 오차 내 가장 최근 거래 + 최근 3개월 거래 건수를 한 번에 조회
+    # (건수는 윈도우 집계라 LIMIT 1 이전에 전체 범위로 계산됨)
+    cutoff = datetime.now() - timedelta(days=RECENT_COUNT_DAYS)
     recent = (
-        db.query(RealTransaction)
+        db.query(
+            RealTransaction.deal_price,
+            RealTransaction.deal_date,
+            func.count(RealTransaction.id)
+            .filter(RealTransaction.deal_date >= cutoff)
+            .over()
+            .label("deal_count"),
+        )
         .filter(
             RealTransaction.complex_id == complex_id,
             RealTransaction.area_sqm.between(
@@ -64,25 +78,10 @@ def _get_recent_deal(
     if recent is None:
         return None
 
-    # 최근 3개월 거래 건수
-    cutoff = datetime.now() - timedelta(days=RECENT_COUNT_DAYS)
-    deal_count = (
-        db.query(func.count(RealTransaction.id))
-        .filter(
-            RealTransaction.complex_id == complex_id,
-            RealTransaction.area_sqm.between(
-                area_sqm - area_tolerance, area_sqm + area_tolerance
-            ),
-            RealTransaction.deal_date >= cutoff,
-        )
-        .scalar()
-        or 0
-    )
-
     return {
         "deal_price": recent.deal_price,
         "deal_date": recent.deal_date,
-        "deal_count": deal_count,
+        "deal_count": recent.deal_count or 0,
     }
 
 
@@ -92,7 +91,7 @@ def update_all_comparisons(db: Session) -> Dict[str, Any]:
     KB시세가 존재하는 단지/면적 조합을 순회하며:
       1. 최근 실거래가 조회
       2. 할인율 계산
-      3. ComplexComparison upsert
+      3. ComplexComparison upsert (신규 행은 마지막에 일괄 INSERT)
 
     Args:
         db: SQLAlchemy 세션
@@ -103,13 +102,21 @@ def update_all_comparisons(db: Session) -> Dict[str, Any]:
     updated = 0
     skipped = 0
 
+    # 기존 비교 데이터를 한 번에 조회 (KB시세 행마다 SELECT하지 않음)
+    existing_by_key: Dict[Tuple[int, float], ComplexComparison] = {
+        (comp.complex_id, comp.area_sqm): comp
+        for comp in db.query(ComplexComparison)
+    }
+    new_rows = []
+
     # KB시세가 있는 모든 (complex_id, area_sqm) 조합 조회
-    kb_rows = db.query(KBPrice).all()
+    # 전체를 리스트로 올리지 않고 서버 사이드 커서로 1000건씩 순회
+    kb_rows = (
+        db.query(KBPrice.complex_id, KBPrice.area_sqm, KBPrice.price_mid)
+        .yield_per(KB_ROWS_CHUNK_SIZE)
+    )
 
-    for kb in kb_rows:
-        complex_id = kb.complex_id
-        area_sqm = kb.area_sqm
-        kb_mid = kb.price_mid
+    for complex_id, area_sqm, kb_mid in kb_rows:
 
         if kb_mid is None:
             skipped += 1
@@ -130,14 +137,7 @@ def update_all_comparisons(db: Session) -> Dict[str, Any]:
         discount_rate = (kb_mid - deal_price) / kb_mid * 100
 
         # ComplexComparison upsert
-        existing = (
-            db.query(ComplexComparison)
-            .filter(
-                ComplexComparison.complex_id == complex_id,
-                ComplexComparison.area_sqm == area_sqm,
-            )
-            .first()
-        )
+        existing = existing_by_key.get((complex_id, area_sqm))
 
         if existing:
             existing.kb_price_mid = kb_mid
@@ -146,20 +146,29 @@ def update_all_comparisons(db: Session) -> Dict[str, Any]:
             existing.deal_discount_rate = round(discount_rate, 2)
             existing.deal_count_3m = deal_count
         else:
-            new_comp = ComplexComparison(
-                complex_id=complex_id,
-                area_sqm=area_sqm,
-                kb_price_mid=kb_mid,
-                recent_deal_price=deal_price,
-                recent_deal_date=deal_date,
-                deal_discount_rate=round(discount_rate, 2),
-                deal_count_3m=deal_count,
-            )
-            db.add(new_comp)
+            # 신규 행은 모아서 한 번에 INSERT (KBPrice가 단지+면적 unique라 키 중복 없음)
+            new_rows.append({
+                "complex_id": complex_id,
+                "area_sqm": area_sqm,
+                "kb_price_mid": kb_mid,
+                "recent_deal_price": deal_price,
+                "recent_deal_date": deal_date,
+                "deal_discount_rate": round(discount_rate, 2),
+                "deal_count_3m": deal_count,
+            })
 
         updated += 1
 
+    if new_rows:
+        db.execute(insert(ComplexComparison), new_rows)
     db.commit()
+    # 크롤링 배치 마지막 단계: 스크립트 등 다른 경로로 추가된 단지도 지역 목록에 반영
+    refresh_region_view(db)
+    cache_service.invalidate(
+        cache_service.DASHBOARD_PATTERN,
+        cache_service.COMPLEX_LIST_PATTERN,
+        *cache_service.REGION_PATTERNS,
+    )
 
     logger.info(
         "단지 비교 갱신 완료: %d건 업데이트, %d건 건너뜀",
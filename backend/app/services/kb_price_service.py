@@ -13,6 +13,8 @@ KB부동산에서 단지별 KB시세를 조회하고 DB에 저장합니다.
 import asyncio
 import logging
 from collections import defaultdict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
@@ -20,9 +22,27 @@ from sqlalchemy.orm import Session
 from app.crawler.kb_price_client import KBPriceClient
 from app.models.apartment import ApartmentComplex, KBPrice
 from app.models.database import SessionLocal
+from app.services import cache_service
 
 logger = logging.getLogger(__name__)
 
+# 지역 수집 시 이 단지 수씩 조회·저장·커밋 (실패 시 잃는 작업량과 조회 결과·세션 메모리 제한)
+REGION_COMMIT_BATCH = 20
+
+
+def _kb_target(complex_obj: ApartmentComplex) -> Dict[str, Any]:
+    """단지 객체 → KBPriceClient.get_prices_for_complex() 인자.
+
+    dong_code가 있으면 직접 사용 (DONG_LAWDCD_MAP 불필요).
+    """
+    return {
+        "complex_name": complex_obj.name,
+        "sido": complex_obj.sido,
+        "sigungu": complex_obj.sigungu,
+        "dong": complex_obj.dong,
+        "dong_code": getattr(complex_obj, "dong_code", None),
+    }
+
 
 class KBPriceService:
     """KB시세 수집/저장 서비스.
@@ -76,33 +96,40 @@ class KBPriceService:
             - kb_hcpc_no: 매칭된 KB 단지 코드 (실패 시 None)
             - saved_count: 저장된 시세 항목 수
         """
-        complex_name = complex_obj.name
-        sido = complex_obj.sido
-        sigungu = complex_obj.sigungu
-        dong = complex_obj.dong
-
         logger.info(
             "KB시세 조회 시작: [%d] %s (%s %s %s)",
-            complex_obj.id, complex_name, sido, sigungu, dong or "",
+            complex_obj.id, complex_obj.name,
+            complex_obj.sido, complex_obj.sigungu, complex_obj.dong or "",
         )
 
         # 1) KB 단지 매칭 및 시세 조회
-        # dong_code가 있으면 직접 사용 (DONG_LAWDCD_MAP 불필요)
-        dong_code = getattr(complex_obj, 'dong_code', None)
         hcpc_no, prices = await self._client.get_prices_for_complex(
-            complex_name=complex_name,
-            sido=sido,
-            sigungu=sigungu,
-            dong=dong,
-            dong_code=dong_code,
+            **_kb_target(complex_obj),
         )
 
+        # 2) DB에 시세 저장
+        return hcpc_no, self._save_complex_prices(db, complex_obj, hcpc_no, prices)
+
+    def _save_complex_prices(
+        self,
+        db: Session,
+        complex_obj: ApartmentComplex,
+        hcpc_no: Optional[str],
+        prices: List[Dict[str, Any]],
+    ) -> int:
+        """조회한 단지 KB시세를 통계에 반영하고 DB에 upsert.
+
+        Returns:
+            저장된 시세 항목 수
+        """
+        complex_name = complex_obj.name
+
         if hcpc_no is None:
             logger.warning(
                 "KB 단지 매칭 실패: [%d] %s", complex_obj.id, complex_name,
             )
             self._stats["match_failures"] += 1
-            return None, 0
+            return 0
 
         self._stats["matched_complexes"] += 1
 
@@ -112,9 +139,8 @@ class KBPriceService:
                 complex_obj.id, complex_name, hcpc_no,
             )
             self._stats["price_fetch_failures"] += 1
-            return hcpc_no, 0
+            return 0
 
-        # 2) DB에 시세 upsert
         saved_count = _upsert_kb_prices(db, complex_obj.id, prices)
         self._stats["prices_saved"] += saved_count
 
@@ -123,7 +149,7 @@ class KBPriceService:
             complex_obj.id, complex_name, saved_count, hcpc_no,
         )
 
-        return hcpc_no, saved_count
+        return saved_count
 
     # ──────────────────────────────────────────
     # 지역별 배치 처리
@@ -149,7 +175,8 @@ class KBPriceService:
         logger.info("===== KB시세 수집 시작: %s %s =====", sido, sigungu)
         self._reset_stats()
 
-        db = SessionLocal()
+        # 중간 커밋 후에도 단지 객체를 다시 조회하지 않도록 만료하지 않음
+        db = SessionLocal(expire_on_commit=False)
         try:
             # 해당 지역의 아파트 단지 조회
             complexes = db.query(ApartmentComplex).filter(
@@ -170,24 +197,40 @@ class KBPriceService:
                 sido, sigungu, len(complexes),
             )
 
-            # 각 단지에 대해 KB시세 조회 및 저장
-            for i, complex_obj in enumerate(complexes, 1):
-                try:
-                    logger.info(
-                        "진행: [%d/%d] %s",
-                        i, len(complexes), complex_obj.name,
-                    )
-                    await self.update_prices_for_complex(db, complex_obj)
-                except Exception as e:
-                    self._stats["errors"] += 1
-                    logger.error(
-                        "KB시세 처리 실패 [%d] %s: %s",
-                        complex_obj.id, complex_obj.name, str(e),
-                        exc_info=True,
-                    )
+            # REGION_COMMIT_BATCH개 단지씩 조회 → 저장 → 커밋
+            # (중간에 중단돼도 커밋된 묶음은 남고, 조회 결과는 한 묶음만 메모리에 유지)
+            for start in range(0, len(complexes), REGION_COMMIT_BATCH):
+                batch = complexes[start:start + REGION_COMMIT_BATCH]
 
-            # 모든 단지 처리 완료 후 커밋
-            db.commit()
+                # 묶음 안의 단지별 KB시세를 동시에 조회 (호출 속도는 클라이언트 토큰 버킷이 제한)
+                results = await self._client.get_prices_for_complexes(
+                    [_kb_target(c) for c in batch], return_exceptions=True,
+                )
+
+                # DB 저장은 한 세션에서 순서대로
+                for i, (complex_obj, result) in enumerate(zip(batch, results), start + 1):
+                    try:
+                        logger.info(
+                            "진행: [%d/%d] %s",
+                            i, len(complexes), complex_obj.name,
+                        )
+                        if isinstance(result, Exception):
+                            raise result
+                        self._save_complex_prices(db, complex_obj, *result)
+                    except Exception as e:
+                        self._stats["errors"] += 1
+                        logger.error(
+                            "KB시세 처리 실패 [%d] %s: %s",
+                            complex_obj.id, complex_obj.name, e,
+                            exc_info=True,
+                        )
+
+                # 묶음마다 커밋하고 세션 identity map 비우기
+                # (이미 읽은 단지 속성은 분리된 객체에 그대로 남음)
+                db.commit()
+                db.expunge_all()
+
+            cache_service.invalidate(cache_service.DASHBOARD_PATTERN)
 
             logger.info(
                 "===== KB시세 수집 완료: %s %s =====\n"
@@ -209,7 +252,7 @@ class KBPriceService:
         except Exception as e:
             db.rollback()
             logger.error(
-                "KB시세 수집 중 치명적 에러: %s", str(e), exc_info=True,
+                "KB시세 수집 중 치명적 에러: %s", e, exc_info=True,
             )
             raise
         finally:
@@ -256,7 +299,7 @@ class KBPriceService:
             except Exception as e:
                 logger.error(
                     "지역 KB시세 수집 실패 (%s %s): %s",
-                    sido, sigungu, str(e),
+                    sido, sigungu, e,
                 )
                 results.append({
                     "sido": sido,
@@ -283,6 +326,8 @@ class KBPriceService:
         개선 방식(동 단위 배치 + 병렬):
           1) dong_code로 단지 그룹화 → get_complex_list는 동당 1번만 호출
           2) Semaphore(concurrency)로 N개 동 동시 처리
+          3) DB 저장은 전용 스레드 1개에서 순서대로 실행
+             (저장하는 동안 이벤트 루프는 다음 API 요청을 계속 진행)
 
         Args:
             concurrency: 동시 처리할 동(dong) 수 (기본 5)
@@ -294,7 +339,10 @@ class KBPriceService:
         start = time.time()
         logger.info("===== KB시세 고속 수집 시작 (concurrency=%d) =====", concurrency)
 
-        db = SessionLocal()
+        # 커밋 후에도 단지 속성을 다시 읽지 않도록 만료하지 않음
+        # (세션 SQL은 DB 스레드에서만 실행되고, 이벤트 루프는 로드된 속성만 읽음)
+        db = SessionLocal(expire_on_commit=False)
+        db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kb-db")
         try:
             # dong_code가 있는 단지만 대상 (없으면 KB API 조회 불가)
             complexes = (
@@ -322,7 +370,7 @@ class KBPriceService:
             # 각 동 그룹을 Semaphore로 병렬 처리
             semaphore = asyncio.Semaphore(concurrency)
             tasks = [
-                self._process_dong_group(dong_code, group, semaphore, db)
+                self._process_dong_group(dong_code, group, semaphore, db, db_executor)
                 for dong_code, group in dong_groups.items()
             ]
             results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -339,12 +387,14 @@ class KBPriceService:
             for r in results:
                 if isinstance(r, Exception):
                     total_stats["errors"] += 1
-                    logger.error("동 처리 예외: %s", str(r))
+                    logger.error("동 처리 예외: %s", r)
                 elif isinstance(r, dict):
                     total_stats["matched"] += r.get("matched", 0)
                     total_stats["saved"] += r.get("saved", 0)
                     total_stats["failed"] += r.get("failed", 0)
 
+            cache_service.invalidate(cache_service.DASHBOARD_PATTERN)
+
             elapsed = time.time() - start
             logger.info(
                 "===== KB시세 고속 수집 완료 =====\n"
@@ -364,6 +414,7 @@ class KBPriceService:
             return total_stats
 
         finally:
+            db_executor.shutdown(wait=True)
             db.close()
 
     async def _process_dong_group(
@@ -372,16 +423,19 @@ class KBPriceService:
         complexes: List[ApartmentComplex],
         semaphore: asyncio.Semaphore,
         db: Session,
+        db_executor: Executor,
     ) -> Dict[str, int]:
         """하나의 dong_code에 속한 단지들의 KB시세를 배치 처리.
 
         get_complex_list를 1번만 호출하고, 결과를 해당 동의 모든 단지에 재사용.
+        매칭된 단지들의 시세는 동시에 조회하고, DB 저장은 순서대로 한다.
 
         Args:
             dong_code: 법정동코드 10자리
             complexes: 해당 동의 ApartmentComplex 목록
             semaphore: 동시 처리 수 제한
-            db: SQLAlchemy 세션
+            db: SQLAlchemy 세션 (db_executor 스레드에서만 사용)
+            db_executor: DB 저장을 순서대로 실행할 단일 스레드 executor
 
         Returns:
             {"matched": int, "saved": int, "failed": int}
@@ -402,29 +456,46 @@ class KBPriceService:
                 stats["failed"] = len(complexes)
                 return stats
 
-            # 2. 각 DB 단지를 KB 목록에서 매칭 후 시세 조회
+            # 2. 각 DB 단지를 KB 목록에서 매칭
+            matched_complexes: List[Tuple[ApartmentComplex, int]] = []
             for complex_obj in complexes:
                 try:
                     matched = self._client.match_from_list(
                         complex_obj.name, kb_list, dong=complex_obj.dong,
                     )
-                    if not matched:
+                    if matched:
+                        matched_complexes.append(
+                            (complex_obj, int(matched["단지기본일련번호"]))
+                        )
+                    else:
                         stats["failed"] += 1
-                        continue
-
-                    kb_id = int(matched["단지기본일련번호"])
-                    prices = await self._client.get_all_prices(kb_id)
+                except Exception as e:
+                    stats["failed"] += 1
+                    logger.error(
+                        "단지 매칭 실패 [%d] %s: %s",
+                        complex_obj.id, complex_obj.name, e,
+                    )
 
+            # 3. 매칭된 단지들의 시세를 동시에 조회한 뒤 순서대로 저장
+            results = await asyncio.gather(
+                *(self._client.get_all_prices(kb_id) for _, kb_id in matched_complexes),
+                return_exceptions=True,
+            )
+            loop = asyncio.get_running_loop()
+            for (complex_obj, _), prices in zip(matched_complexes, results):
+                try:
+                    if isinstance(prices, Exception):
+                        raise prices
                     if prices:
-                        saved = _upsert_kb_prices(db, complex_obj.id, prices)
-                        db.commit()
+                        saved = await loop.run_in_executor(
+                            db_executor, _save_and_commit, db, complex_obj.id, prices,
+                        )
                         stats["matched"] += 1
                         stats["saved"] += saved
                     else:
                         stats["failed"] += 1
 
                 except Exception as e:
-                    db.rollback()
                     stats["failed"] += 1
                     logger.error(
                         "단지 처리 실패 [%d] %s: %s",
@@ -446,7 +517,8 @@ def _upsert_kb_prices(
     """KB시세 데이터를 KBPrice 테이블에 upsert (insert or update).
 
     동일 단지+면적 조합이 이미 존재하면 가격을 갱신하고,
-    없으면 새로 삽입합니다.
+    없으면 새로 삽입합니다. 가격이 그대로인 행은 행별 UPDATE 대신
+    마지막에 updated_at만 일괄 갱신합니다.
 
     Args:
         db: SQLAlchemy 세션
@@ -458,6 +530,16 @@ def _upsert_kb_prices(
         저장(insert + update)된 항목 수
     """
     saved_count = 0
+    now = datetime.now()
+    # 가격 변동 없는 기존 행 id (확인 시각만 일괄 갱신)
+    unchanged_ids: List[int] = []
+
+    # 이 단지의 기존 시세를 한 번에 조회 (면적마다 SELECT하지 않음)
+    # (complex_id + area_sqm unique constraint)
+    existing_by_area: Dict[float, KBPrice] = {
+        row.area_sqm: row
+        for row in db.query(KBPrice).filter(KBPrice.complex_id == complex_id)
+    }
 
     for price_data in prices:
         area_sqm = price_data.get("area_sqm")
@@ -468,23 +550,25 @@ def _upsert_kb_prices(
         price_mid = price_data.get("price_mid")
         price_upper = price_data.get("price_upper")
 
-        # 기존 레코드 조회 (complex_id + area_sqm unique constraint)
-        existing = db.query(KBPrice).filter(
-            KBPrice.complex_id == complex_id,
-            KBPrice.area_sqm == area_sqm,
-        ).first()
+        existing = existing_by_area.get(area_sqm)
 
         if existing:
-            # 기존 시세 갱신 (가격이 동일해도 updated_at을 명시적으로 갱신해
-            # SQLAlchemy가 반드시 UPDATE를 발행하도록 함)
-            from datetime import datetime
-            if price_lower is not None:
-                existing.price_lower = price_lower
-            if price_mid is not None:
-                existing.price_mid = price_mid
-            if price_upper is not None:
-                existing.price_upper = price_upper
-            existing.updated_at = datetime.now()
+            # None인 값은 기존 가격 유지
+            new_values = (
+                existing.price_lower if price_lower is None else price_lower,
+                existing.price_mid if price_mid is None else price_mid,
+                existing.price_upper if price_upper is None else price_upper,
+            )
+            if new_values == (existing.price_lower, existing.price_mid, existing.price_upper):
+                # 가격 동일: 행 UPDATE 생략 (대시보드 최종 갱신 시각용 updated_at은 일괄 갱신)
+                if existing.id is not None:
+                    unchanged_ids.append(existing.id)
+                saved_count += 1
+                continue
+
+            # 기존 시세 갱신
+            existing.price_lower, existing.price_mid, existing.price_upper = new_values
+            existing.updated_at = now
             logger.debug(
                 "KB시세 갱신: complex_id=%d, area=%.2f, "
                 "lower=%s, mid=%s, upper=%s",
@@ -500,6 +584,7 @@ def _upsert_kb_prices(
                 price_upper=price_upper,
             )
             db.add(new_price)
+            existing_by_area[area_sqm] = new_price
             logger.debug(
                 "KB시세 신규 삽입: complex_id=%d, area=%.2f, "
                 "lower=%s, mid=%s, upper=%s",
@@ -508,9 +593,29 @@ def _upsert_kb_prices(
 
         saved_count += 1
 
+    if unchanged_ids:
+        db.query(KBPrice).filter(KBPrice.id.in_(unchanged_ids)).update(
+            {"updated_at": now}, synchronize_session=False,
+        )
+
     return saved_count
 
 
+def _save_and_commit(
+    db: Session,
+    complex_id: int,
+    prices: List[Dict[str, Any]],
+) -> int:
+    """단지 KB시세 upsert 후 커밋 (실패 시 롤백 후 예외 전달). DB 스레드에서 실행."""
+    try:
+        saved = _upsert_kb_prices(db, complex_id, prices)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return saved
+
+
 def get_kb_prices_for_complex(
     db: Session,
     complex_id: int,
@@ -6,16 +6,21 @@
 - 매칭 실패 시 실거래가 정보를 바탕으로 신규 단지 자동 생성
 """
 
+import asyncio
 import logging
 import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
-from sqlalchemy import and_, desc, func
+from sqlalchemy import desc, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.apartment import ApartmentComplex, RealTransaction
+from app.models.region import refresh_region_view
 from app.crawler.real_transaction_client import RealTransactionClient, get_lawd_cd
+from app.services import cache_service
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +28,18 @@ logger = logging.getLogger(__name__)
 AREA_TOLERANCE = 1.0
 
 
+# 정규화 결과 캐시 크기 (같은 시군구 단지명이 거래마다 반복 정규화됨)
+NAME_CACHE_SIZE = 16384
+
+# 단지명 정규화 정규식 (저장 시 단지 매칭마다 반복 호출되므로 미리 컴파일)
+_RE_PAREN = re.compile(r'\([^)]*\)')
+_RE_DONG_LIST = re.compile(r'[\d,]+동.*$')
+_RE_DONG_RANGE = re.compile(r'\d+동[~\-]\d+동')
+_RE_DONG_SUFFIX = re.compile(r'\d+동$')
+_RE_SEPARATORS = re.compile(r'[\s\-·・]')
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def _normalize_name(name: str) -> str:
     """아파트명을 정규화하여 매칭률을 높인다.
 
@@ -33,23 +50,55 @@ def _normalize_name(name: str) -> str:
       4. 숫자 뒤의 "차" 유지: "현대2차" → "현대2차"
     """
     # 괄호 내용 제거
-    name = re.sub(r'\([^)]*\)', '', name)
+    name = _RE_PAREN.sub('', name)
     # 쉼표 이후 동 정보 제거: "1동,2동,3동" 패턴
-    name = re.sub(r'[\d,]+동.*$', '', name)
+    name = _RE_DONG_LIST.sub('', name)
     # "101동~106동", "101동~111동" 패턴 제거
-    name = re.sub(r'\d+동[~\-]\d+동', '', name)
+    name = _RE_DONG_RANGE.sub('', name)
     # 끝에 붙은 동/호 번호 제거: "103동" 패턴
-    name = re.sub(r'\d+동$', '', name)
+    name = _RE_DONG_SUFFIX.sub('', name)
     # 공백, 특수문자 제거
-    name = re.sub(r'[\s\-·・]', '', name)
+    name = _RE_SEPARATORS.sub('', name)
     return name.strip()
 
 
+class _RegionNames(NamedTuple):
+    """시/군/구 단지명 인덱스 (저장 배치당 한 번 만들어 아파트명마다 재사용)."""
+
+    by_name: Dict[str, int]                # 원본 단지명 → id
+    by_no_space: Dict[str, int]            # 공백 제거명 → id
+    by_norm: Dict[str, int]                # 정규화명 → id
+    norms: List[Tuple[str, int]]           # (정규화명, id) — 3글자 이상, 상호 포함 비교용
+
+
+def _add_region_name(index: _RegionNames, name: str, complex_id: int) -> None:
+    """인덱스에 단지 1개를 추가한다 (같은 키는 먼저 들어온 단지 유지)."""
+    index.by_name.setdefault(name, complex_id)
+    index.by_no_space.setdefault(name.replace(" ", ""), complex_id)
+    norm = _normalize_name(name)
+    index.by_norm.setdefault(norm, complex_id)
+    if len(norm) >= 3:
+        index.norms.append((norm, complex_id))
+
+
+def _load_region_names(db: Session, sido: str, sigungu: str) -> _RegionNames:
+    """시/군/구의 전체 단지명을 한 번 조회해 매칭용 인덱스를 만든다."""
+    index = _RegionNames({}, {}, {}, [])
+    rows = db.query(ApartmentComplex.id, ApartmentComplex.name).filter(
+        ApartmentComplex.sido == sido,
+        ApartmentComplex.sigungu == sigungu,
+    )
+    for complex_id, name in rows:
+        _add_region_name(index, name, complex_id)
+    return index
+
+
 def _match_complex(
     db: Session,
     apt_name: str,
     sido: str,
     sigungu: str,
+    names: Optional[_RegionNames] = None,
 ) -> Optional[int]:
     """아파트명과 지역 정보로 DB의 ApartmentComplex를 매칭한다.
 
@@ -65,26 +114,22 @@ def _match_complex(
         apt_name: 실거래가 API에서 받은 아파트명
         sido: 시/도 이름
         sigungu: 시/군/구 이름
+        names: 시/군/구 단지명 인덱스 (없으면 새로 조회)
 
     Returns:
         매칭된 ApartmentComplex의 id, 실패 시 None
     """
+    if names is None:
+        names = _load_region_names(db, sido, sigungu)
+
     # 전략 1: 정확히 일치
-    complex_row = (
-        db.query(ApartmentComplex)
-        .filter(
-            ApartmentComplex.sido == sido,
-            ApartmentComplex.sigungu == sigungu,
-            ApartmentComplex.name == apt_name,
-        )
-        .first()
-    )
-    if complex_row is not None:
-        return complex_row.id
+    complex_id = names.by_name.get(apt_name)
+    if complex_id is not None:
+        return complex_id
 
     # 전략 2: LIKE 검색 - API명이 DB명에 포함
     complex_row = (
-        db.query(ApartmentComplex)
+        db.query(ApartmentComplex.id)
         .filter(
             ApartmentComplex.sido == sido,
             ApartmentComplex.sigungu == sigungu,
@@ -95,44 +140,29 @@ def _match_complex(
     if complex_row is not None:
         return complex_row.id
 
-    # 이하 전략은 전체 단지를 한 번만 조회하여 재사용
-    all_complexes = (
-        db.query(ApartmentComplex)
-        .filter(
-            ApartmentComplex.sido == sido,
-            ApartmentComplex.sigungu == sigungu,
-        )
-        .all()
-    )
-
     # 전략 3: 공백 제거 후 정확히 비교
-    api_no_space = apt_name.replace(" ", "")
-    for cpx in all_complexes:
-        if cpx.name.replace(" ", "") == api_no_space:
-            return cpx.id
+    complex_id = names.by_no_space.get(apt_name.replace(" ", ""))
+    if complex_id is not None:
+        return complex_id
 
     # 전략 4: 정규화 후 정확히 비교
     api_norm = _normalize_name(apt_name)
     if len(api_norm) >= 2:  # 너무 짧은 이름은 오매칭 방지
-        for cpx in all_complexes:
-            db_norm = _normalize_name(cpx.name)
-            if api_norm == db_norm:
-                return cpx.id
+        complex_id = names.by_norm.get(api_norm)
+        if complex_id is not None:
+            return complex_id
 
     # 전략 5: 정규화명 상호 포함 (긴 쪽이 짧은 쪽을 포함)
     if len(api_norm) >= 3:  # 최소 3글자 이상
         best_match = None
         best_len = 0
-        for cpx in all_complexes:
-            db_norm = _normalize_name(cpx.name)
-            if len(db_norm) < 3:
-                continue
+        for db_norm, complex_id in names.norms:
             # 양방향 substring 매칭
             if api_norm in db_norm or db_norm in api_norm:
                 # 더 긴 매칭을 우선 (정확도 높음)
                 match_len = min(len(api_norm), len(db_norm))
                 if match_len > best_len:
-                    best_match = cpx.id
+                    best_match = complex_id
                     best_len = match_len
         if best_match is not None:
             return best_match
@@ -166,7 +196,7 @@ def _create_complex(
     """
     # 멱등성 보장: 동일 (sido, sigungu, name) 이미 존재하면 기존 반환
     existing = (
-        db.query(ApartmentComplex)
+        db.query(ApartmentComplex.id)
         .filter(
             ApartmentComplex.sido == sido,
             ApartmentComplex.sigungu == sigungu,
@@ -190,43 +220,43 @@ def _create_complex(
     return new_complex.id
 
 
-def _is_duplicate(
+# 중복 판정 키: (단지, 전용면적, 층, 거래일, 거래금액)
+_TxKey = Tuple[int, float, Optional[int], datetime, int]
+
+
+def _load_existing_keys(
     db: Session,
-    complex_id: int,
-    area_sqm: float,
-    floor: Optional[int],
-    deal_date: datetime,
-    deal_price: int,
-) -> bool:
-    """동일한 실거래가 데이터가 이미 DB에 존재하는지 확인한다.
+    complex_ids: List[int],
+    date_from: datetime,
+    date_to: datetime,
+) -> set:
+    """이번 배치와 겹치는 기존 거래의 중복 판정 키를 한 번에 조회한다.
 
     단지 + 전용면적 + 층 + 거래일 + 거래금액이 모두 일치하면 중복으로 판단한다.
+    거래마다 존재 여부를 조회하지 않도록 배치의 단지/거래일 범위로 한정해 미리 읽어온다.
 
     Args:
         db: SQLAlchemy 세션
-        complex_id: 아파트 단지 ID
-        area_sqm: 전용면적 (m2)
-        floor: 층
-        deal_date: 거래일자
-        deal_price: 거래금액 (만원)
+        complex_ids: 배치에 포함된 단지 ID 목록
+        date_from: 배치의 최소 거래일
+        date_to: 배치의 최대 거래일
 
     Returns:
-        중복이면 True
+        기존 거래 키 set
     """
-    filters = [
-        RealTransaction.complex_id == complex_id,
-        RealTransaction.area_sqm == area_sqm,
-        RealTransaction.deal_date == deal_date,
-        RealTransaction.deal_price == deal_price,
-    ]
-    # 층 정보가 있으면 조건에 추가, 없으면 NULL 체크
-    if floor is not None:
-        filters.append(RealTransaction.floor == floor)
-    else:
-        filters.append(RealTransaction.floor.is_(None))
-
-    exists = db.query(RealTransaction).filter(and_(*filters)).first()
-    return exists is not None
+    rows = db.execute(
+        select(
+            RealTransaction.complex_id,
+            RealTransaction.area_sqm,
+            RealTransaction.floor,
+            RealTransaction.deal_date,
+            RealTransaction.deal_price,
+        ).where(
+            RealTransaction.complex_id.in_(complex_ids),
+            RealTransaction.deal_date.between(date_from, date_to),
+        )
+    )
+    return {tuple(row) for row in rows}
 
 
 def save_transactions(
@@ -256,13 +286,16 @@ def save_transactions(
 
     # 매칭 캐시: {아파트명 -> complex_id}
     match_cache: Dict[str, int] = {}
+    # 시/군/구 단지명 인덱스 (미매칭 아파트명마다 전체 단지를 다시 조회하지 않음)
+    names = _load_region_names(db, sido, sigungu) if transactions else None
 
+    # 1) 단지 매칭 (아파트명별 1회)
     for tx in transactions:
         apt_name = tx["apt_name"]
 
         # 캐시에서 매칭 결과 조회
         if apt_name not in match_cache:
-            existing_id = _match_complex(db, apt_name, sido, sigungu)
+            existing_id = _match_complex(db, apt_name, sido, sigungu, names)
             if existing_id is not None:
                 match_cache[apt_name] = existing_id
             else:
@@ -276,36 +309,49 @@ def save_transactions(
                     build_year=tx.get("build_year"),
                 )
                 match_cache[apt_name] = new_id
+                _add_region_name(names, apt_name, new_id)
                 created_count += 1
 
-        complex_id = match_cache[apt_name]
-
-        # 중복 확인
-        if _is_duplicate(
-            db,
-            complex_id=complex_id,
-            area_sqm=tx["area_sqm"],
-            floor=tx["floor"],
-            deal_date=tx["deal_date"],
-            deal_price=tx["deal_price"],
-        ):
+    # 2) 중복 확인: 기존 거래 키를 한 번에 읽어 메모리에서 비교
+    existing_keys = _load_existing_keys(
+        db,
+        complex_ids=list(set(match_cache.values())),
+        date_from=min(tx["deal_date"] for tx in transactions),
+        date_to=max(tx["deal_date"] for tx in transactions),
+    ) if transactions else set()
+
+    new_rows: List[Dict[str, Any]] = []
+    for tx in transactions:
+        complex_id = match_cache[tx["apt_name"]]
+        key: _TxKey = (
+            complex_id, tx["area_sqm"], tx["floor"], tx["deal_date"], tx["deal_price"],
+        )
+        if key in existing_keys:
             duplicate_count += 1
             continue
 
-        # DB에 저장
-        record = RealTransaction(
-            complex_id=complex_id,
-            area_sqm=tx["area_sqm"],
-            floor=tx["floor"],
-            deal_price=tx["deal_price"],
-            deal_date=tx["deal_date"],
-        )
-        db.add(record)
-        saved_count += 1
+        new_rows.append({
+            "complex_id": complex_id,
+            "area_sqm": tx["area_sqm"],
+            "floor": tx["floor"],
+            "deal_price": tx["deal_price"],
+            "deal_date": tx["deal_date"],
+        })
+
+    # 3) 일괄 INSERT (ORM 객체 생성 없이 executemany 배치 실행)
+    if new_rows:
+        db.execute(insert(RealTransaction), new_rows)
+        saved_count = len(new_rows)
 
     # 일괄 커밋 (신규 단지 + 실거래가)
     if saved_count > 0 or created_count > 0:
         db.commit()
+        # 신규 단지가 생기면 지역 목록도 바뀔 수 있음
+        patterns = [cache_service.DASHBOARD_PATTERN, cache_service.TX_SUMMARY_PATTERN]
+        if created_count > 0:
+            refresh_region_view(db)
+            patterns.extend(cache_service.REGION_PATTERNS)
+        cache_service.invalidate(*patterns)
 
     logger.info(
         "실거래가 저장 완료: %s %s - 저장=%d, 중복=%d, 신규단지=%d",
@@ -352,9 +398,9 @@ async def collect_and_save(
                 "unmatched": 0,
             }
 
-        # DB에 저장
-        saved, duplicates, created = save_transactions(
-            db, transactions, sido, sigungu,
+        # DB에 저장 (동기 세션 작업이므로 스레드에서 실행해 이벤트 루프를 막지 않음)
+        saved, duplicates, created = await asyncio.to_thread(
+            save_transactions, db, transactions, sido, sigungu,
         )
 
         return {
@@ -372,8 +418,8 @@ async def collect_and_save(
         await client.close()
 
 
-def get_transactions_by_complex(
-    db: Session,
+async def get_transactions_by_complex(
+    db: AsyncSession,
     complex_id: int,
     limit: int = 20,
     area_sqm: Optional[float] = None,
@@ -381,7 +427,7 @@ def get_transactions_by_complex(
     """특정 단지의 최근 실거래가를 조회한다.
 
     Args:
-        db: SQLAlchemy 세션
+        db: SQLAlchemy 비동기 세션
         complex_id: 아파트 단지 ID (apartment_complex.id)
         limit: 최대 조회 건수 (기본 20)
         area_sqm: 전용면적 필터 (m2, 선택)
@@ -389,8 +435,8 @@ def get_transactions_by_complex(
     Returns:
         실거래가 딕셔너리 리스트 (최근 거래일 순)
     """
-    query = (
-        db.query(
+    stmt = (
+        select(
             RealTransaction.id,
             RealTransaction.area_sqm,
             RealTransaction.floor,
@@ -402,20 +448,21 @@ def get_transactions_by_complex(
             ApartmentComplex,
             RealTransaction.complex_id == ApartmentComplex.id,
         )
-        .filter(RealTransaction.complex_id == complex_id)
+        .where(RealTransaction.complex_id == complex_id)
     )
 
     # 전용면적 필터 (선택)
     if area_sqm is not None:
-        query = query.filter(RealTransaction.area_sqm == area_sqm)
+        stmt = stmt.where(RealTransaction.area_sqm == area_sqm)
 
     # 최근 거래일 순 정렬
     rows = (
-        query
-        .order_by(desc(RealTransaction.deal_date))
-        .limit(limit)
-        .all()
-    )
+        await db.execute(
+            stmt
+            .order_by(desc(RealTransaction.deal_date))
+            .limit(limit)
+        )
+    ).all()
 
     results: List[Dict[str, Any]] = []
     for row in rows:
@@ -431,15 +478,15 @@ def get_transactions_by_complex(
     return results
 
 
-def get_transaction_summary(
-    db: Session,
+async def get_transaction_summary(
+    db: AsyncSession,
     complex_id: int,
     area_sqm: Optional[float] = None,
 ) -> Optional[Dict[str, Any]]:
     """특정 단지의 실거래가 요약 통계를 반환한다.
 
     Args:
-        db: SQLAlchemy 세션
+        db: SQLAlchemy 비동기 세션
         complex_id: 아파트 단지 ID
         area_sqm: 전용면적 필터 (m2, 선택)
 
@@ -447,44 +494,37 @@ def get_transaction_summary(
         요약 딕셔너리 (총 건수, 최근거래가, 최고가, 최저가, 평균가),
         데이터 없으면 None
     """
-    query = (
-        db.query(
-            func.count(RealTransaction.id).label("total_count"),
-            func.max(RealTransaction.deal_price).label("max_price"),
-            func.min(RealTransaction.deal_price).label("min_price"),
-            func.avg(RealTransaction.deal_price).label("avg_price"),
+    # 최근 거래 1건 + 전체 집계를 윈도우 함수로 한 번에 조회
+    # (집계는 LIMIT 1 이전에 전체 행 기준으로 계산됨)
+    stmt = (
+        select(
+            RealTransaction.deal_price,
+            RealTransaction.deal_date,
+            func.count(RealTransaction.id).over().label("total_count"),
+            func.max(RealTransaction.deal_price).over().label("max_price"),
+            func.min(RealTransaction.deal_price).over().label("min_price"),
+            func.avg(RealTransaction.deal_price).over().label("avg_price"),
         )
-        .filter(RealTransaction.complex_id == complex_id)
+        .where(RealTransaction.complex_id == complex_id)
     )
 
     if area_sqm is not None:
-        query = query.filter(RealTransaction.area_sqm == area_sqm)
+        stmt = stmt.where(RealTransaction.area_sqm == area_sqm)
 
-    result = query.first()
+    latest = (
+        await db.execute(stmt.order_by(desc(RealTransaction.deal_date)).limit(1))
+    ).first()
 
-    if result is None or result.total_count == 0:
+    if latest is None:
         return None
 
-    # 가장 최근 거래 조회
-    latest_query = (
-        db.query(RealTransaction)
-        .filter(RealTransaction.complex_id == complex_id)
-    )
-    if area_sqm is not None:
-        latest_query = latest_query.filter(
-            RealTransaction.area_sqm == area_sqm,
-        )
-    latest = latest_query.order_by(
-        desc(RealTransaction.deal_date),
-    ).first()
-
     return {
-        "total_count": result.total_count,
-        "max_price": result.max_price,
-        "min_price": result.min_price,
-        "avg_price": int(result.avg_price) if result.avg_price else None,
-        "latest_price": latest.deal_price if latest else None,
+        "total_count": latest.total_count,
+        "max_price": latest.max_price,
+        "min_price": latest.min_price,
+        "avg_price": int(latest.avg_price) if latest.avg_price else None,
+        "latest_price": latest.deal_price,
         "latest_date": (
-            latest.deal_date.isoformat() if latest and latest.deal_date else None
+            latest.deal_date.isoformat() if latest.deal_date else None
         ),
     }
@@ -1,11 +1,15 @@
+from functools import lru_cache
 from typing import Dict, List
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     DATABASE_URL: str = "postgresql://suelee@localhost:5432/find_my_home"
 
+    # Redis 캐시 (비어 있으면 캐시 없이 DB 직접 조회)
+    REDIS_URL: str = ""
+
     # KB시세 수집 스케줄
     KB_PRICE_CRON_HOUR: int = 6
     KB_PRICE_CRON_MINUTE: int = 0
@@ -127,9 +131,14 @@ class Settings(BaseSettings):
         {"sido": "울산광역시", "sigungu": "울주군"},
     ]
 
-    class Config:
-        env_file = ".env"
-        extra = "ignore"
+    # 실행 중 변경하지 않는 설정이므로 frozen
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", frozen=True)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """설정 싱글턴 (.env 파싱은 최초 1회만, FastAPI Depends용)."""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
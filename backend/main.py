@@ -5,14 +5,21 @@ import logging
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.regions import router as regions_router
 from app.api.transactions import router as transactions_router
 from app.api.complexes import router as complexes_router
 from app.api.dashboard import router as dashboard_router
 from app.api.alerts import router as alerts_router
-from app.models.database import engine, Base
+from app.models.database import engine, Base, create_missing_indexes
 from app.models.apartment import ApartmentComplex, KBPrice, RealTransaction, ComplexComparison  # noqa: F401
+from app.models.region import create_region_view
+from app.crawler.kb_price_client import close_kb_client, init_kb_client
+from app.crawler.real_transaction_client import (
+    close_real_transaction_client,
+    init_real_transaction_client,
+)
 from app.crawler.scheduler import start_scheduler, stop_scheduler
 
 # 로깅 설정
@@ -25,6 +32,8 @@ app = FastAPI(
     title="Find My Home API",
     description="KB시세 대비 급매물 탐지 서비스 API",
     version="0.2.0",
+    # 응답 JSON 직렬화를 orjson으로 (목록 API 응답이 큼)
+    default_response_class=ORJSONResponse,
 )
 
 # -----------------------------------------------------------
@@ -56,15 +65,21 @@ app.include_router(alerts_router)
 # -----------------------------------------------------------
 @app.on_event("startup")
 async def on_startup():
-    """서버 시작 시 DB 테이블 생성 후 스케줄러를 등록합니다."""
+    """서버 시작 시 DB 테이블/인덱스/지역 뷰 생성 후 스케줄러를 등록합니다."""
     Base.metadata.create_all(bind=engine)
+    create_missing_indexes(engine)
+    create_region_view(engine)
+    await init_kb_client()
+    await init_real_transaction_client()
     start_scheduler()
 
 
 @app.on_event("shutdown")
 async def on_shutdown():
-    """서버 종료 시 스케줄러를 정리합니다."""
+    """서버 종료 시 스케줄러와 외부 API 클라이언트를 정리합니다."""
     stop_scheduler()
+    await close_kb_client()
+    await close_real_transaction_client()
 
 
 @app.get("/", tags=["health"])
@@ -120,7 +120,7 @@ async def run(resume: bool = False):
             except Exception as e:
                 logger.error(
                     "[%d/%d] 에러: %s %s - %s",
-                    idx, total_regions, sido, sigungu, str(e),
+                    idx, total_regions, sido, sigungu, e,
                     exc_info=True,
                 )
                 # 에러 발생해도 계속 진행
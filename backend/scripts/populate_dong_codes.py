@@ -21,6 +21,9 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import logging
+
+from sqlalchemy import func
+
 from app.models.database import SessionLocal
 from app.models.apartment import ApartmentComplex
 from app.crawler.kb_price_client import get_lawdcd
@@ -42,39 +45,51 @@ def populate_dong_codes() -> None:
     """DONG_LAWDCD_MAP을 이용해 dong_code가 없는 단지에 동-level 코드를 채운다."""
     db = SessionLocal()
     try:
-        # dong_code가 없는 단지 전체 조회
-        complexes = (
-            db.query(ApartmentComplex)
+        # dong_code는 (시/도, 시/군/구, 동)으로만 정해지므로 단지 행 대신 동 단위로 집계해 조회
+        # (단지 id 목록을 메모리에 올려 IN 절로 다시 보내지 않음)
+        dong_groups = (
+            db.query(
+                ApartmentComplex.sido,
+                ApartmentComplex.sigungu,
+                ApartmentComplex.dong,
+                func.count(ApartmentComplex.id),
+            )
             .filter(ApartmentComplex.dong_code.is_(None))
+            .group_by(ApartmentComplex.sido, ApartmentComplex.sigungu, ApartmentComplex.dong)
             .all()
         )
 
-        total = len(complexes)
-        logger.info("dong_code 없는 단지 수: %d개", total)
+        total = sum(count for *_, count in dong_groups)
+        logger.info("dong_code 없는 단지 수: %d개 (%d개 동)", total, len(dong_groups))
 
         updated = 0
         skipped_no_code = 0
         skipped_gu_level = 0
 
-        for i, c in enumerate(complexes, 1):
+        for i, (sido, sigungu, dong, count) in enumerate(dong_groups, 1):
             if i % 500 == 0:
-                logger.info("진행: %d/%d (업데이트: %d)", i, total, updated)
+                logger.info("진행: %d/%d동 (업데이트: %d)", i, len(dong_groups), updated)
 
             # DONG_LAWDCD_MAP에서 동-level 코드 조회
-            code = get_lawdcd(c.sido, c.sigungu, c.dong)
+            code = get_lawdcd(sido, sigungu, dong)
 
             if not code:
-                skipped_no_code += 1
+                skipped_no_code += count
                 continue
 
             if not is_dong_level_code(code):
                 # gu-level fallback 코드는 저장하지 않음 (KB API에서 빈 결과)
-                skipped_gu_level += 1
+                skipped_gu_level += count
                 continue
 
-            c.dong_code = code
-            updated += 1
-
+            # 동마다 UPDATE ... WHERE 시/도, 시/군/구, 동 일치 한 번
+            db.query(ApartmentComplex).filter(
+                ApartmentComplex.dong_code.is_(None),
+                ApartmentComplex.sido == sido,
+                ApartmentComplex.sigungu == sigungu,
+                ApartmentComplex.dong == dong,
+            ).update({"dong_code": code}, synchronize_session=False)
+            updated += count
         db.commit()
 
         logger.info(
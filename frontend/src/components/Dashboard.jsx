@@ -9,7 +9,7 @@
  * - 60초 자동 새로고침 + 수동 새로고침
  */
 import { useState, useEffect, useCallback, useRef } from 'react';
-import { getDashboardSummary, getSchedulerStatus, getRegionBreakdown, getAlertsBargains } from '../services/api';
+import { getDashboardBootstrap, getAlertsBargains } from '../services/api';
 
 /** 자동 새로고침 간격 (ms) */
 const AUTO_REFRESH_INTERVAL = 60_000;
@@ -317,14 +317,10 @@ export default function Dashboard() {
     setLoading(true);
     setError(null);
     try {
-      const [summaryData, schedulerData, regionsData] = await Promise.all([
-        getDashboardSummary(),
-        getSchedulerStatus(),
-        getRegionBreakdown(),
-      ]);
-      setSummary(summaryData);
-      setScheduler(schedulerData);
-      setRegions(regionsData);
+      const data = await getDashboardBootstrap();
+      setSummary(data.summary);
+      setScheduler(data.scheduler);
+      setRegions(data.regions);
     } catch (err) {
       console.error('대시보드 데이터 로드 실패:', err);
       setError(err.message || '데이터를 불러오는 데 실패했습니다.');
@@ -69,6 +69,16 @@ export async function getSigunguList(sido) {
  */
 /* ─── 대시보드 API ─── */
 
+/**
+ * 대시보드 초기 데이터 조회 (요약 + 스케줄러 + 지역별 통계를 한 번에)
+ * @returns {Promise<{summary: Object, scheduler: Object, regions: Object}>}
+ */
+export async function getDashboardBootstrap() {
+  const response = await fetch(`${API_BASE_URL}/dashboard/bootstrap`);
+  if (!response.ok) throw new Error('대시보드 데이터를 불러오는 데 실패했습니다.');
+  return convertKeys(await response.json());
+}
+
 /**
  * DB 요약 통계 조회
  * @returns {Promise<Object>} 단지수, 매물수, KB시세, 급매 등 통계
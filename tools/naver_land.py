@@ -1,9 +1,16 @@
 """네이버 부동산 API 도구 - CrewAI Tool 데코레이터 사용"""
 
 import json
+import random
+import threading
 import time
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from crewai.tools import tool
 
 # 공통 헤더
@@ -23,13 +30,150 @@ HEADERS = {
 
 BASE_URL = "https://new.land.naver.com/api"
 
+# URL 템플릿 (고정 쿼리는 모듈 로드 시 한 번만 조립, 호출 시 단지 번호/거래유형만 채움)
+COMPLEX_URL = BASE_URL + "/complexes/{complex_no}?sameAddressGroup=false"
+ARTICLES_URL = (
+    BASE_URL + "/complexes/{complex_no}/articles?"
+    "realEstateType=APT&tradeType={trade_type}"
+    "&tag=%3A%3A%3A%3A%3A%3A&rentPriceMin=0&rentPriceMax=900000000"
+    "&priceMin=0&priceMax=900000000&areaMin=0&areaMax=900000000"
+    "&oldBuildYears&recentlyBuildYears&minHouseHoldCount"
+    "&maxHouseHoldCount&showArticle=false&sameAddressGroup=true"
+    "&sortedBy=prc&page=1"
+)
+
+# 연결 풀 크기 (new/m/fin.land 호스트별 keep-alive 연결 수)
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 8
+
+
+def _new_session() -> requests.Session:
+    """keep-alive 연결 풀을 쓰는 세션 생성 (요청마다 TCP+TLS 연결을 새로 맺지 않음)."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# 모든 도구 호출이 공유하는 세션
+_SESSION = _new_session()
+
+# 요청 간격 (초) — 네이버 차단 방지용 호출 속도 상한 (초당 2.5건)
+REQUEST_INTERVAL = 0.4
+# 동시에 진행 중인 요청 수 상한
+MAX_IN_FLIGHT = 4
+
+# 매물 조회 거래유형 (코드, 표시명)
+TRADE_TYPES = (("A1", "매매"), ("B1", "전세"))
+
+# 재시도 설정 (429/5xx 응답, 연결 오류·타임아웃)
+MAX_RETRIES = 3
+RETRY_BACKOFF_MAX = 30.0
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+# 응답 본문 크기 상한 (bytes)
+MAX_BODY_BYTES = 5 * 1024 * 1024
+
+# 도구 결과 캐시 (성공한 결과만 저장, 못 찾음/오류는 다음 호출에서 재시도)
+CACHE_MAX_ENTRIES = 256
+SEARCH_CACHE_TTL = 86400   # 단지명 → complexNo (거의 바뀌지 않음)
+LISTINGS_CACHE_TTL = 300   # 단지별 매물 목록 (같은 실행 안에서 반복 조회 흡수)
+
+_rate_lock = threading.Lock()
+_next_slot = 0.0
+_in_flight = threading.BoundedSemaphore(MAX_IN_FLIGHT)
+_search_cache: dict[str, tuple[float, str]] = {}
+_listings_cache: dict[str, tuple[float, str]] = {}
+
+
+def _wait_for_slot():
+    """다음 요청 시각을 예약하고 그때까지 대기한다.
+
+    요청마다 무조건 쉬지 않고, 직전 요청과의 간격이 REQUEST_INTERVAL보다
+    짧을 때만 남은 시간만큼 기다린다. 여러 스레드가 동시에 불러도
+    예약 시각이 겹치지 않아 전체 호출 속도가 상한을 넘지 않는다.
+    """
+    global _next_slot
+    with _rate_lock:
+        now = time.monotonic()
+        wait = _next_slot - now
+        _next_slot = max(now, _next_slot) + REQUEST_INTERVAL
+    if wait > 0:
+        time.sleep(wait)
+
+
+def _retry_after_seconds(resp: requests.Response) -> float:
+    """Retry-After 헤더(초 단위)를 읽는다. 없거나 날짜 형식이면 0."""
+    try:
+        return max(float(resp.headers.get("Retry-After", 0)), 0.0)
+    except ValueError:
+        return 0.0
+
+
+def _cache_get(cache: dict, key: str, ttl: float) -> str | None:
+    """TTL 캐시 조회 (만료된 항목은 삭제 후 None)."""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    stored_at, value = entry
+    if time.monotonic() - stored_at >= ttl:
+        cache.pop(key, None)
+        return None
+    return value
+
+
+def _cache_set(cache: dict, key: str, value: str):
+    """TTL 캐시 저장 (가득 차면 가장 먼저 저장된 항목부터 삭제)."""
+    if len(cache) >= CACHE_MAX_ENTRIES:
+        cache.pop(next(iter(cache)), None)
+    cache[key] = (time.monotonic(), value)
+
+
+def _content_length(resp: requests.Response) -> int:
+    """Content-Length 헤더 값 (없거나 잘못된 값이면 0)."""
+    try:
+        return int(resp.headers.get("Content-Length", 0))
+    except ValueError:
+        return 0
+
 
 def _request_get(url: str, headers: dict | None = None, allow_redirects: bool = True) -> requests.Response:
-    """공통 GET 요청 + 딜레이"""
+    """공통 GET 요청 (호출 속도 제한 + 동시 요청 수 제한 + 재시도)
+
+    429/5xx 응답과 연결 오류는 decorrelated jitter 백오프로 재시도한다
+    (대기 = min(상한, uniform(간격, 직전 대기 × 3))). 429의 Retry-After가
+    더 길면 그 값을 따른다. 마지막 시도의 응답/예외는 그대로 호출자에게 넘긴다.
+    Content-Length가 MAX_BODY_BYTES를 넘는 응답은 본문을 받지 않고 ValueError.
+    """
     h = headers or HEADERS
-    time.sleep(0.4)
-    resp = requests.get(url, headers=h, timeout=10, allow_redirects=allow_redirects)
-    return resp
+    get = _SESSION.get
+    wait = REQUEST_INTERVAL
+    for attempt in range(1, MAX_RETRIES + 1):
+        resp = None
+        try:
+            with _in_flight:
+                _wait_for_slot()
+                resp = get(
+                    url, headers=h, timeout=10, allow_redirects=allow_redirects, stream=True,
+                )
+                # 본문을 받기 전에 크기 확인 (비정상적으로 큰 응답은 읽지 않고 연결 종료)
+                if _content_length(resp) > MAX_BODY_BYTES:
+                    resp.close()
+                    raise ValueError(f"응답이 너무 큼 ({_content_length(resp)} bytes): {url}")
+                resp.content  # 본문을 끝까지 읽어 연결을 풀에 반환
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == MAX_RETRIES:
+                raise
+        else:
+            if resp.status_code not in RETRY_STATUS or attempt == MAX_RETRIES:
+                return resp
+
+        # 재시도 간격이 겹치지 않도록 무작위로 퍼뜨림 (동시 호출이 한꺼번에 재시도하지 않게)
+        wait = min(RETRY_BACKOFF_MAX, random.uniform(REQUEST_INTERVAL, wait * 3))
+        if resp is not None and resp.status_code == 429:
+            wait = max(wait, _retry_after_seconds(resp))
+        time.sleep(wait)
 
 
 @tool("search_apartment_complex")
@@ -37,6 +181,11 @@ def search_apartment_complex(apartment_name: str) -> str:
     """아파트 이름으로 네이버 부동산에서 단지를 검색합니다.
     아파트 이름(예: '래미안퍼스티지', '반포자이')을 입력하면
     해당하는 단지의 complexNo, 이름, 주소 목록을 반환합니다."""
+    # 단지명 → complexNo는 거의 바뀌지 않으므로 찾은 결과는 재사용
+    cached = _cache_get(_search_cache, apartment_name, SEARCH_CACHE_TTL)
+    if cached is not None:
+        return cached
+
     results = []
 
     try:
@@ -46,7 +195,7 @@ def search_apartment_complex(apartment_name: str) -> str:
         )
         resp = _request_get(autocomplete_url)
         if resp.status_code == 200:
-            data = resp.json()
+            data = orjson.loads(resp.content)
             # complexes 키에서 단지 정보 추출
             complexes = data.get("complexes", [])
             for c in complexes:
@@ -87,20 +236,39 @@ def search_apartment_complex(apartment_name: str) -> str:
             ensure_ascii=False,
         )
 
-    return json.dumps(results, ensure_ascii=False)
+    output = json.dumps(results, ensure_ascii=False)
+    _cache_set(_search_cache, apartment_name, output)
+    return output
 
 
 @tool("get_complex_listings")
 def get_complex_listings(complex_no: str) -> str:
     """단지 번호(complexNo)로 현재 매물 목록을 조회합니다.
     매매/전세 매물의 가격, 층수, 면적, 거래유형 등을 반환합니다."""
+    cached = _cache_get(_listings_cache, complex_no, LISTINGS_CACHE_TTL)
+    if cached is not None:
+        return cached
+
     try:
-        # 1) 단지 기본 정보 조회
-        complex_url = f"{BASE_URL}/complexes/{complex_no}?sameAddressGroup=false"
-        resp = _request_get(complex_url)
+        # 단지 정보 + 거래유형별 매물을 동시에 요청 (호출 속도 제한은 _request_get이 지킴)
+        complex_url = COMPLEX_URL.format(complex_no=complex_no)
+        with ThreadPoolExecutor(max_workers=1 + len(TRADE_TYPES)) as pool:
+            complex_future = pool.submit(_request_get, complex_url)
+            article_futures = [
+                (trade_name, pool.submit(
+                    _request_get,
+                    ARTICLES_URL.format(complex_no=complex_no, trade_type=trade_type),
+                ))
+                for trade_type, trade_name in TRADE_TYPES
+            ]
+
+        # 1) 단지 기본 정보
+        resp = complex_future.result()
         complex_info = {}
+        # 모든 요청이 성공했을 때만 결과를 캐시 (일부 실패한 결과는 재사용하지 않음)
+        complete = resp.status_code == 200
         if resp.status_code == 200:
-            data = resp.json()
+            data = orjson.loads(resp.content)
             complex_data = data.get("complexDetail", data)
             complex_info = {
                 "complexName": complex_data.get("complexName", ""),
@@ -109,40 +277,36 @@ def get_complex_listings(complex_no: str) -> str:
                 "approvalDate": complex_data.get("useApproveYmd", ""),
             }
 
-        # 2) 매매 매물 조회
+        # 2) 매매/전세 매물
+        # 단지 공통 값은 매물마다 다시 꺼내지 않고 한 번만 조회
+        complex_name = complex_info.get("complexName", "")
+        address = complex_info.get("address", "")
         listings = []
-        for trade_type, trade_name in [("A1", "매매"), ("B1", "전세")]:
-            articles_url = (
-                f"{BASE_URL}/complexes/{complex_no}/articles?"
-                f"realEstateType=APT&tradeType={trade_type}"
-                f"&tag=%3A%3A%3A%3A%3A%3A&rentPriceMin=0&rentPriceMax=900000000"
-                f"&priceMin=0&priceMax=900000000&areaMin=0&areaMax=900000000"
-                f"&oldBuildYears&recentlyBuildYears&minHouseHoldCount"
-                f"&maxHouseHoldCount&showArticle=false&sameAddressGroup=true"
-                f"&sortedBy=prc&page=1"
-            )
-            resp = _request_get(articles_url)
-            if resp.status_code == 200:
-                data = resp.json()
+        for trade_name, future in article_futures:
+            resp = future.result()
+            if resp.status_code != 200:
+                complete = False
+            else:
+                data = orjson.loads(resp.content)
                 article_list = data.get("articleList", [])
                 for article in article_list:
-                    price = article.get("dealOrWarrantPrc", "")
-                    # 가격 문자열 → 숫자 변환 ("12억 5,000" → 125000)
-                    price_manwon = _parse_price(price)
+                    get = article.get
+                    price = get("dealOrWarrantPrc", "")
 
                     listings.append({
-                        "complex_name": complex_info.get("complexName", ""),
-                        "address": complex_info.get("address", ""),
-                        "articleNo": article.get("articleNo", ""),
-                        "area_pyeong": article.get("areaName", ""),
-                        "area_m2": article.get("area1", article.get("area2", "")),
-                        "floor": article.get("floorInfo", ""),
+                        "complex_name": complex_name,
+                        "address": address,
+                        "articleNo": get("articleNo", ""),
+                        "area_pyeong": get("areaName", ""),
+                        "area_m2": get("area1", get("area2", "")),
+                        "floor": get("floorInfo", ""),
                         "price_text": price,
-                        "price_manwon": price_manwon,
+                        # 가격 문자열 → 숫자 변환 ("12억 5,000" → 125000)
+                        "price_manwon": _parse_price(price),
                         "trade_type": trade_name,
-                        "direction": article.get("direction", ""),
-                        "article_confirm_date": article.get("articleConfirmYmd", ""),
-                        "realtor_name": article.get("realtorName", ""),
+                        "direction": get("direction", ""),
+                        "article_confirm_date": get("articleConfirmYmd", ""),
+                        "realtor_name": get("realtorName", ""),
                     })
 
         result = {
@@ -150,7 +314,10 @@ def get_complex_listings(complex_no: str) -> str:
             "total_listings": len(listings),
             "listings": listings,
         }
-        return json.dumps(result, ensure_ascii=False)
+        output = json.dumps(result, ensure_ascii=False)
+        if complete:
+            _cache_set(_listings_cache, complex_no, output)
+        return output
 
     except Exception as e:
         return json.dumps({"error": f"매물 조회 중 오류 발생: {str(e)}"}, ensure_ascii=False)
@@ -172,7 +339,7 @@ def get_article_detail(article_no: str) -> str:
         }
         resp = _request_get(detail_url, headers=detail_headers)
         if resp.status_code == 200:
-            data = resp.json()
+            data = orjson.loads(resp.content)
             return json.dumps(data, ensure_ascii=False)
         else:
             return json.dumps(
@@ -183,13 +350,20 @@ def get_article_detail(article_no: str) -> str:
         return json.dumps({"error": f"상세 조회 중 오류: {str(e)}"}, ensure_ascii=False)
 
 
+# 가격 문자열에서 지울 문자 (콤마, 공백) — 한 번의 translate로 제거
+_PRICE_STRIP_TABLE = str.maketrans("", "", ", ")
+
+
+@lru_cache(maxsize=4096)
 def _parse_price(price_str: str) -> int:
     """네이버 부동산 가격 문자열을 만원 단위 정수로 변환.
     예: '12억 5,000' → 125000, '3억' → 30000, '5,500' → 5500
+
+    같은 호가가 매물마다 반복되므로 변환 결과를 캐시한다.
     """
     if not price_str:
         return 0
-    price_str = price_str.replace(",", "").replace(" ", "")
+    price_str = price_str.translate(_PRICE_STRIP_TABLE)
     total = 0
     # '억' 단위 처리
     if "억" in price_str: